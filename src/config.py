@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Literal
+from typing import List, Literal
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -66,6 +66,35 @@ class PDFParserSettings(BaseConfigSettings):
     do_ocr: bool = False
     do_table_structure: bool = True
 
+    # Threaded Docling pipeline: pages per batch for each model stage. A stage runs a
+    # batch once it is full or batch_max_wait_ms after its first page, whichever is first.
+    layout_batch_size: int = 4
+    table_batch_size: int = 4
+    ocr_batch_size: int = 4
+    batch_max_wait_ms: int = 2000
+
+    # Model runtime: device ("auto", "cpu", "cuda", "cuda:N", "mps") and CPU threads per model in the
+    # API process (pool workers use worker_torch_threads). artifacts_path points at pre-downloaded
+    # weights ("" downloads them); fast_table_structure swaps in the smaller TableFormer model.
+    accelerator_device: str = "auto"
+    num_threads: int = 4
+    artifacts_path: str = ""
+    fast_table_structure: bool = False
+
+    # Worker processes that run Docling conversions (0 converts in a thread of the calling process).
+    # Opt-in for batch ingestion such as the Airflow DAGs; each worker loads its own copy of the
+    # models, so keep this small.
+    num_workers: int = 0
+    worker_torch_threads: int = 2
+
+    # PDF data batch ingestion may hold in memory for files read ahead of conversion
+    read_ahead_mb: int = 64
+
+    # Opt-in on-disk cache of parsed results keyed by PDF content hash ("" disables it).
+    # Relative paths are resolved against the working directory when the parser is built.
+    cache_dir: str = ""
+    cache_max_size_mb: int = 1024
+
 
 class ChunkingSettings(BaseConfigSettings):
     model_config = SettingsConfigDict(
@@ -95,6 +124,24 @@ class OpenSearchSettings(BaseConfigSettings):
     index_name: str = "arxiv-papers"
     chunk_index_suffix: str = "chunks"  # Creates single hybrid index: {index_name}-{suffix}
     max_text_size: int = 1000000
+    refresh_interval: str = "30s"  # Set "1s" on search-heavy deployments
+    number_of_shards: int = 2
+    translog_flush_threshold: str = "1gb"
+    translog_durability: str = "async"  # "request" fsyncs every write; "async" fsyncs every 5s
+    pool_maxsize: int = 32  # Pooled HTTP connections kept open per OpenSearch node
+
+    # Search result cache (per client, in-process). Off by default: papers indexed by another
+    # process (the Airflow DAG) only show up in cached results once the TTL runs out
+    result_cache_enabled: bool = False
+    result_cache_size: int = 1024  # Maximum cached result sets
+    result_cache_ttl_seconds: int = 30  # Longest a cached result can lag behind the index
+
+    # Retry a BM25 search with fuzzy matching when the exact search finds nothing
+    fuzzy_fallback_enabled: bool = True
+
+    # Category filters warmed at startup and periodically (size-0 searches with request_cache)
+    hot_categories: List[str] = Field(default_factory=lambda: ["cs.AI", "cs.CL", "cs.LG", "cs.CV", "stat.ML"])
+    category_warmup_interval_seconds: int = 900  # 0 disables the periodic warm-up
 
     # Vector search settings
     vector_dimension: int = 1024  # Jina embeddings dimension
@@ -104,6 +151,12 @@ class OpenSearchSettings(BaseConfigSettings):
     rrf_pipeline_name: str = "hybrid-rrf-pipeline"
     hybrid_search_size_multiplier: int = 2  # Get k*multiplier for better recall
 
+    # Bulk indexing settings (parallel_bulk)
+    bulk_thread_count: int = min(8, os.cpu_count() or 1)
+    bulk_chunk_size: int = 500  # Documents per _bulk request
+    bulk_max_chunk_bytes: int = 50 * 1024 * 1024  # Upper bound on a single _bulk request body
+    bulk_queue_size: int = 4  # Pending _bulk requests buffered per thread pool
+
 
 class Settings(BaseConfigSettings):
     app_version: str = "0.1.0"
@@ -7,7 +7,9 @@ from src.config import Settings
 from src.db.interfaces.base import BaseDatabase
 from src.services.arxiv.client import ArxivClient
 from src.services.embeddings.jina_client import JinaEmbeddingsClient
+from src.services.opensearch.async_client import AsyncOpenSearchClient
 from src.services.opensearch.client import OpenSearchClient
+from src.services.pdf_parser.factory import make_pdf_parser_service
 from src.services.pdf_parser.parser import PDFParserService
 
 
@@ -38,14 +40,19 @@ def get_opensearch_client(request: Request) -> OpenSearchClient:
     return request.app.state.opensearch_client
 
 
+def get_async_opensearch_client(request: Request) -> AsyncOpenSearchClient:
+    """Get async OpenSearch client from the request state."""
+    return request.app.state.async_opensearch_client
+
+
 def get_arxiv_client(request: Request) -> ArxivClient:
     """Get arXiv client from the request state."""
     return request.app.state.arxiv_client
 
 
-def get_pdf_parser(request: Request) -> PDFParserService:
-    """Get PDF parser service from the request state."""
-    return request.app.state.pdf_parser
+def get_pdf_parser() -> PDFParserService:
+    """Get the shared PDF parser service, building it (and loading its models) on first use."""
+    return make_pdf_parser_service()
 
 
 def get_embeddings_service(request: Request) -> JinaEmbeddingsClient:
@@ -58,6 +65,7 @@ SettingsDep = Annotated[Settings, Depends(get_settings)]
 DatabaseDep = Annotated[BaseDatabase, Depends(get_database)]
 SessionDep = Annotated[Session, Depends(get_db_session)]
 OpenSearchDep = Annotated[OpenSearchClient, Depends(get_opensearch_client)]
+AsyncOpenSearchDep = Annotated[AsyncOpenSearchClient, Depends(get_async_opensearch_client)]
 ArxivDep = Annotated[ArxivClient, Depends(get_arxiv_client)]
 PDFParserDep = Annotated[PDFParserService, Depends(get_pdf_parser)]
 EmbeddingsDep = Annotated[JinaEmbeddingsClient, Depends(get_embeddings_service)]
@@ -1,6 +1,7 @@
+import asyncio
 import logging
 import os
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 import uvicorn
 from fastapi import FastAPI
@@ -9,8 +10,13 @@ from src.db.factory import make_database
 from src.routers import hybrid_search, papers, ping
 from src.services.arxiv.factory import make_arxiv_client
 from src.services.embeddings.factory import make_embeddings_service
-from src.services.opensearch.factory import make_opensearch_client
-from src.services.pdf_parser.factory import make_pdf_parser_service
+from src.services.opensearch.async_client import AsyncOpenSearchClient
+from src.services.opensearch.factory import (
+    make_async_opensearch_client,
+    make_opensearch_client,
+    reset_async_opensearch_client,
+)
+from src.services.pdf_parser.factory import reset_pdf_parser
 
 # Setup logging
 logging.basicConfig(
@@ -20,6 +26,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+async def _warm_category_filters_periodically(client: AsyncOpenSearchClient, interval_seconds: int) -> None:
+    """Re-warm hot category filters so their caches survive refreshes and merges."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        await client.warm_category_filters()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -49,6 +62,9 @@ async def lifespan(app: FastAPI):
         else:
             logger.info("Hybrid index already exists")
 
+        # Touch postings for popular category filters before the first search
+        opensearch_client.warm_category_filters()
+
         # Get simple statistics
         try:
             stats = opensearch_client.client.count(index=opensearch_client.index_name)
@@ -58,16 +74,35 @@ async def lifespan(app: FastAPI):
     else:
         logger.warning("OpenSearch connection failed - search features will be limited")
 
+    # Async client shared by search endpoints for the lifetime of the app
+    app.state.async_opensearch_client = make_async_opensearch_client()
+
+    warmup_task = None
+    if settings.opensearch.category_warmup_interval_seconds > 0:
+        warmup_task = asyncio.create_task(
+            _warm_category_filters_periodically(
+                app.state.async_opensearch_client, settings.opensearch.category_warmup_interval_seconds
+            )
+        )
+
     # Initialize other services (kept for future endpoints and notebook demos)
+    # The PDF parser loads its models on first use (see get_pdf_parser), not at startup
     app.state.arxiv_client = make_arxiv_client()
-    app.state.pdf_parser = make_pdf_parser_service()
     app.state.embeddings_service = make_embeddings_service()
-    logger.info("Services initialized: arXiv API client, PDF parser, OpenSearch, Embeddings")
+    logger.info("Services initialized: arXiv API client, OpenSearch, Embeddings")
 
     logger.info("API ready")
     yield
 
     # Cleanup
+    if warmup_task is not None:
+        warmup_task.cancel()
+        # Let an in-flight warm-up request unwind before its client is closed
+        with suppress(asyncio.CancelledError):
+            await warmup_task
+    await reset_async_opensearch_client()
+    # Shutting down the parse pool waits for its workers, so keep it off the event loop
+    await asyncio.to_thread(reset_pdf_parser)
     database.teardown()
     logger.info("API shutdown complete")
 
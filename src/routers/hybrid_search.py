@@ -1,8 +1,9 @@
+import asyncio
 import logging
 
-from fastapi import APIRouter, HTTPException
-from src.dependencies import EmbeddingsDep, OpenSearchDep
-from src.schemas.api.search import HybridSearchRequest, SearchHit, SearchResponse
+from fastapi import APIRouter, HTTPException, Response
+from src.dependencies import AsyncOpenSearchDep, EmbeddingsDep
+from src.schemas.api.search import HybridSearchRequest, SearchHit, SearchRequest, SearchResponse
 
 logger = logging.getLogger(__name__)
 
@@ -11,27 +12,33 @@ router = APIRouter(prefix="/hybrid-search", tags=["hybrid-search"])
 
 @router.post("/", response_model=SearchResponse)
 async def hybrid_search(
-    request: HybridSearchRequest, opensearch_client: OpenSearchDep, embeddings_service: EmbeddingsDep
+    request: HybridSearchRequest, opensearch_client: AsyncOpenSearchDep, embeddings_service: EmbeddingsDep
 ) -> SearchResponse:
     """
     Hybrid search endpoint supporting multiple search modes.
     """
     try:
-        if not opensearch_client.health_check():
+        # Check cluster health and embed the query concurrently
+        if request.use_hybrid:
+            healthy, embedding_result = await asyncio.gather(
+                opensearch_client.health_check(), embeddings_service.embed_query(request.query), return_exceptions=True
+            )
+        else:
+            healthy, embedding_result = await opensearch_client.health_check(), None
+
+        if healthy is not True:
             raise HTTPException(status_code=503, detail="Search service is currently unavailable")
 
         query_embedding = None
-        if request.use_hybrid:
-            try:
-                query_embedding = await embeddings_service.embed_query(request.query)
-                logger.info("Generated query embedding for hybrid search")
-            except Exception as e:
-                logger.warning(f"Failed to generate embeddings, falling back to BM25: {e}")
-                query_embedding = None
+        if isinstance(embedding_result, BaseException):
+            logger.warning(f"Failed to generate embeddings, falling back to BM25: {embedding_result}")
+        elif embedding_result is not None:
+            query_embedding = embedding_result
+            logger.info("Generated query embedding for hybrid search")
 
         logger.info(f"Hybrid search: '{request.query}' (hybrid: {request.use_hybrid and query_embedding is not None})")
 
-        results = opensearch_client.search_unified(
+        results = await opensearch_client.search_unified(
             query=request.query,
             query_embedding=query_embedding,
             size=request.size,
@@ -77,3 +84,26 @@ async def hybrid_search(
     except Exception as e:
         logger.error(f"Hybrid search error: {e}")
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
+
+
+@router.post("/trimmed", response_class=Response)
+async def bm25_search_trimmed(request: SearchRequest, opensearch_client: AsyncOpenSearchDep) -> Response:
+    """
+    BM25 search returning OpenSearch's hits JSON trimmed to the fields the API uses, for large result pages.
+
+    Skips building per-hit response models. Applies the same fuzzy fallback as BM25 mode
+    of the main endpoint, but results are not served from the search result cache.
+    """
+    try:
+        body = await opensearch_client.search_papers_trimmed(
+            query=request.query,
+            size=request.size,
+            from_=request.from_,
+            categories=request.categories,
+            latest=request.latest_papers,
+        )
+        return Response(content=body, media_type="application/json")
+
+    except Exception as e:
+        logger.error(f"Trimmed search error: {e}")
+        raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
@@ -61,8 +61,8 @@ async def health_check(settings: SettingsDep, database: DatabaseDep, opensearch_
 
     # Handle Ollama async check separately
     try:
-        ollama_client = OllamaClient(settings)
-        ollama_health = await ollama_client.health_check()
+        async with OllamaClient(settings) as ollama_client:
+            ollama_health = await ollama_client.health_check()
         services["ollama"] = ServiceStatus(status=ollama_health["status"], message=ollama_health["message"])
         if ollama_health["status"] != "healthy":
             overall_status = "degraded"
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -42,7 +42,9 @@ class SearchHit(BaseModel):
 
     arxiv_id: str
     title: str
-    authors: Optional[str]
+    authors: Optional[Union[List[str], str]] = Field(
+        None, description="Author names (documents indexed before authors were stored as an array hold a joined string)"
+    )
     abstract: Optional[str]
     published_date: Optional[str]
     pdf_url: Optional[str]
@@ -1,7 +1,8 @@
 import json
 import logging
 import re
-from typing import Dict, List, Optional, Union
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple, Union
 
 from src.schemas.indexing.models import ChunkMetadata, TextChunk
 
@@ -126,35 +127,30 @@ class TextChunker:
                 ]
             return []
 
-        chunks = []
-        chunk_index = 0
-        current_position = 0
-
-        while current_position < len(words):
-            # Calculate chunk boundaries
-            chunk_start = current_position
-            chunk_end = min(current_position + self.chunk_size, len(words))
-
-            # Extract chunk words
-            chunk_words = words[chunk_start:chunk_end]
-            chunk_text = self._reconstruct_text(chunk_words)
+        # Join once and slice chunks out of it. Word i starts at char_offsets[i] + i in the
+        # joined text (prefix of word lengths plus one separator per preceding word)
+        joined_text = self._reconstruct_text(words)
+        char_offsets = list(accumulate(map(len, words), initial=0))
 
+        chunks = []
+        for chunk_index, (chunk_start, chunk_end) in enumerate(self._compute_chunk_spans(len(words))):
             # Calculate character offsets (approximate)
-            start_char = len(" ".join(words[:chunk_start])) if chunk_start > 0 else 0
-            end_char = len(" ".join(words[:chunk_end]))
+            text_start = char_offsets[chunk_start] + chunk_start
+            start_char = text_start - 1 if chunk_start > 0 else 0
+            end_char = char_offsets[chunk_end] + chunk_end - 1
 
             # Calculate overlaps
             overlap_with_previous = min(self.overlap_size, chunk_start) if chunk_start > 0 else 0
             overlap_with_next = self.overlap_size if chunk_end < len(words) else 0
 
-            # Create chunk
-            chunk = TextChunk(
-                text=chunk_text,
-                metadata=ChunkMetadata(
+            # Create chunk (fields are computed here, so skip pydantic validation)
+            chunk = TextChunk.model_construct(
+                text=joined_text[text_start:end_char],
+                metadata=ChunkMetadata.model_construct(
                     chunk_index=chunk_index,
                     start_char=start_char,
                     end_char=end_char,
-                    word_count=len(chunk_words),
+                    word_count=chunk_end - chunk_start,
                     overlap_with_previous=overlap_with_previous,
                     overlap_with_next=overlap_with_next,
                     section_title=None,  # Could be enhanced with section detection
@@ -164,18 +160,29 @@ class TextChunker:
             )
             chunks.append(chunk)
 
-            # Move to next chunk position (with overlap)
-            current_position += self.chunk_size - self.overlap_size
-            chunk_index += 1
-
-            # Break if we've processed all words
-            if chunk_end >= len(words):
-                break
-
         logger.info(f"Chunked paper {arxiv_id}: {len(words)} words -> {len(chunks)} chunks")
 
         return chunks
 
+    def _compute_chunk_spans(self, num_words: int) -> List[Tuple[int, int]]:
+        """Compute word-index windows for overlapping chunks.
+
+        :param num_words: Total number of words in the text
+        :returns: List of (start, end) word indices, end exclusive
+        """
+        stride = self.chunk_size - self.overlap_size
+        spans = []
+
+        for chunk_start in range(0, num_words, stride):
+            chunk_end = min(chunk_start + self.chunk_size, num_words)
+            spans.append((chunk_start, chunk_end))
+
+            # Stop once the window reaches the end of the text
+            if chunk_end >= num_words:
+                break
+
+        return spans
+
     def _chunk_by_sections(
         self, title: str, abstract: str, arxiv_id: str, paper_id: str, sections: Union[Dict[str, str], str, list]
     ) -> List[TextChunk]:
@@ -206,18 +213,19 @@ class TextChunker:
         chunks = []
         small_sections = []  # Buffer for combining small sections
 
-        section_items = list(sections_dict.items())
+        section_items = [(name, str(content) if content else "") for name, content in sections_dict.items()]
+        # Measure each section once; the small-section lookahead reuses these counts
+        word_counts = [len(content_str.split()) for _, content_str in section_items]
 
-        for i, (section_title, section_content) in enumerate(section_items):
-            content_str = str(section_content) if section_content else ""
-            section_words = len(content_str.split())
+        for i, (section_title, content_str) in enumerate(section_items):
+            section_words = word_counts[i]
 
             if section_words < 100:
                 # Collect small sections to combine later
                 small_sections.append((section_title, content_str, section_words))
 
                 # If this is the last section or next section is large, process accumulated small sections
-                if i == len(section_items) - 1 or len(str(section_items[i + 1][1]).split()) >= 100:
+                if i == len(section_items) - 1 or word_counts[i + 1] >= 100:
                     chunks.extend(self._create_combined_chunk(header, small_sections, chunks, arxiv_id, paper_id))
                     small_sections = []
 
@@ -283,7 +291,7 @@ class TextChunker:
         :returns: Filtered dictionary of sections
         """
         filtered = {}
-        abstract_words = set(abstract.lower().split())
+        abstract_words = frozenset(abstract.lower().split())
 
         for section_title, section_content in sections_dict.items():
             content_str = str(section_content).strip()
@@ -339,7 +347,7 @@ class TextChunker:
 
         return False
 
-    def _is_duplicate_abstract(self, content: str, abstract: str, abstract_words: set) -> bool:
+    def _is_duplicate_abstract(self, content: str, abstract: str, abstract_words: frozenset) -> bool:
         """Check if section content is a duplicate of the abstract."""
         content_lower = content.lower().strip()
         abstract_lower = abstract.lower().strip()
@@ -348,11 +356,16 @@ class TextChunker:
         if abstract_lower in content_lower or content_lower in abstract_lower:
             return True
 
-        # Word overlap check - if >80% of words overlap, likely duplicate
-        content_words = set(content_lower.split())
+        # Sections under half the abstract's length are treated as too short to restate it,
+        # so skip building the word set for them
+        if len(content_lower) < len(abstract_lower) * 0.5:
+            return False
 
+        # Word overlap check - if >80% of words overlap, likely duplicate
         if len(abstract_words) > 10:  # Only check for substantial abstracts
-            overlap = len(abstract_words.intersection(content_words))
+            content_words = set(content_lower.split())
+            # Count shared words without materialising the intersection set
+            overlap = sum(1 for word in content_words if word in abstract_words)
             overlap_ratio = overlap / len(abstract_words)
 
             if overlap_ratio > 0.8:
@@ -397,18 +410,21 @@ class TextChunker:
         # Combine all small sections
         combined_content = []
         total_words = 0
+        labelled_words = 0  # Content words plus the "Section: <title>" label words
 
         for section_title, content, word_count in small_sections:
             combined_content.append(f"Section: {section_title}\n\n{content}")
             total_words += word_count
+            labelled_words += word_count + 1 + len(section_title.split())
 
-        combined_text = f"{header}{'\\n\\n'.join(combined_content)}"
+        sections_text = "\n\n".join(combined_content)
+        combined_text = f"{header}{sections_text}"
 
         # If still too small, combine with previous chunk if possible
         if total_words + len(header.split()) < 200 and existing_chunks:
             # Try to merge with previous chunk
             prev_chunk = existing_chunks[-1]
-            merged_text = f"{prev_chunk.text}\\n\\n{'\\n\\n'.join(combined_content)}"
+            merged_text = f"{prev_chunk.text}\n\n{sections_text}"
 
             # Update the previous chunk
             existing_chunks[-1] = TextChunk(
@@ -417,7 +433,7 @@ class TextChunker:
                     chunk_index=prev_chunk.metadata.chunk_index,
                     start_char=0,
                     end_char=len(merged_text),
-                    word_count=len(merged_text.split()),
+                    word_count=prev_chunk.metadata.word_count + labelled_words,
                     overlap_with_previous=0,
                     overlap_with_next=0,
                     section_title=f"{prev_chunk.metadata.section_title} + Combined",
@@ -470,9 +486,9 @@ class TextChunker:
         for i, chunk in enumerate(traditional_chunks):
             enhanced_text = f"{header}{chunk.text}"
 
-            enhanced_chunk = TextChunk(
+            enhanced_chunk = TextChunk.model_construct(
                 text=enhanced_text,
-                metadata=ChunkMetadata(
+                metadata=ChunkMetadata.model_construct(
                     chunk_index=base_chunk_index + i,
                     start_char=chunk.metadata.start_char,
                     end_char=chunk.metadata.end_char + len(header),
@@ -1,8 +1,9 @@
 import asyncio
 import logging
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
 
 from dateutil import parser as date_parser
 from sqlalchemy.orm import Session
@@ -153,8 +154,9 @@ class MetadataFetcher:
 
         Uses overlapping download+parse pipeline:
         - Downloads happen concurrently (up to max_concurrent_downloads)
-        - As each download completes, parsing starts immediately
-        - Multiple PDFs can be parsing while others are still downloading
+        - As each download completes, its PDF is handed to the parser's parse_many, which
+          reads and validates upcoming PDFs while earlier ones convert
+        - Up to max_concurrent_parsing PDFs convert while others are still downloading
 
         This is optimal for production workloads like 100 papers/day.
 
@@ -177,15 +179,40 @@ class MetadataFetcher:
         logger.info(f"Concurrent downloads: {self.max_concurrent_downloads}")
         logger.info(f"Concurrent parsing: {self.max_concurrent_parsing}")
 
-        # Create semaphores for controlled concurrency
         download_semaphore = asyncio.Semaphore(self.max_concurrent_downloads)
-        parse_semaphore = asyncio.Semaphore(self.max_concurrent_parsing)
+        downloaded: asyncio.Queue = asyncio.Queue()
 
-        # Start all download+parse pipelines concurrently
-        pipeline_tasks = [self._download_and_parse_pipeline(paper, download_semaphore, parse_semaphore) for paper in papers]
+        # Per paper: (download_success, parsed_paper), or the exception that stopped its download
+        pipeline_results: List[Any] = [None] * len(papers)
+        # Papers whose PDFs went to the parser, in the order parse_many returns them
+        parse_order: Deque[int] = deque()
 
-        # Wait for all pipelines to complete
-        pipeline_results = await asyncio.gather(*pipeline_tasks, return_exceptions=True)
+        async def download(index: int, paper: ArxivPaper) -> None:
+            pdf_path = None
+            try:
+                pdf_path = await self._download_pdf(paper, download_semaphore)
+                pipeline_results[index] = (pdf_path is not None, None)
+            except Exception as e:
+                pipeline_results[index] = e
+            finally:
+                downloaded.put_nowait((index, pdf_path))
+
+        async def downloaded_paths() -> AsyncIterator[Path]:
+            # Feed PDFs to the parser in the order their downloads finish
+            for _ in papers:
+                index, pdf_path = await downloaded.get()
+                if pdf_path:
+                    parse_order.append(index)
+                    yield pdf_path
+
+        download_tasks = [asyncio.create_task(download(index, paper)) for index, paper in enumerate(papers)]
+        try:
+            async for _, pdf_content in self.pdf_parser.parse_many(downloaded_paths(), concurrency=self.max_concurrent_parsing):
+                index = parse_order.popleft()
+                pipeline_results[index] = (True, self._build_parsed_paper(papers[index], pdf_content))
+        finally:
+            for task in download_tasks:
+                task.cancel()
 
         # Process results with detailed error tracking
         for paper, result in zip(papers, pipeline_results):
@@ -239,62 +266,54 @@ class MetadataFetcher:
 
         return results
 
-    async def _download_and_parse_pipeline(
-        self, paper: ArxivPaper, download_semaphore: asyncio.Semaphore, parse_semaphore: asyncio.Semaphore
-    ) -> tuple:
+    async def _download_pdf(self, paper: ArxivPaper, download_semaphore: asyncio.Semaphore) -> Optional[Path]:
         """
-        Complete download+parse pipeline for a single paper with true parallelism.
-        Downloads PDF, then immediately starts parsing while other downloads continue.
+        Download one paper's PDF with download concurrency control.
 
         Returns:
-            Tuple of (download_success: bool, parsed_paper: Optional[ParsedPaper])
+            Path to the downloaded PDF, or None if the download failed
         """
-        download_success = False
-        parsed_paper = None
-
         try:
-            # Step 1: Download PDF with download concurrency control
             async with download_semaphore:
                 logger.debug(f"Starting download: {paper.arxiv_id}")
                 pdf_path = await self.arxiv_client.download_pdf(paper, False)
 
                 if pdf_path:
-                    download_success = True
                     logger.debug(f"Download complete: {paper.arxiv_id}")
                 else:
                     logger.error(f"Download failed: {paper.arxiv_id}")
-                    return (False, None)
-
-            # Step 2: Parse PDF with parse concurrency control (happens AFTER download completes)
-            # This allows other downloads to continue while this PDF is being parsed
-            async with parse_semaphore:
-                logger.debug(f"Starting parse: {paper.arxiv_id}")
-                pdf_content = await self.pdf_parser.parse_pdf(pdf_path)
-
-                if pdf_content:
-                    # Create ArxivMetadata from the paper
-                    arxiv_metadata = ArxivMetadata(
-                        title=paper.title,
-                        authors=paper.authors,
-                        abstract=paper.abstract,
-                        arxiv_id=paper.arxiv_id,
-                        categories=paper.categories,
-                        published_date=paper.published_date,
-                        pdf_url=paper.pdf_url,
-                    )
-
-                    # Combine into ParsedPaper
-                    parsed_paper = ParsedPaper(arxiv_metadata=arxiv_metadata, pdf_content=pdf_content)
-                    logger.debug(f"Parse complete: {paper.arxiv_id} - {len(pdf_content.raw_text)} chars extracted")
-                else:
-                    # PDF parsing failed, but this is not critical - we can continue with metadata only
-                    logger.warning(f"PDF parsing failed for {paper.arxiv_id}, continuing with metadata only")
+                return pdf_path
 
         except Exception as e:
             logger.error(f"Pipeline error for {paper.arxiv_id}: {e}")
             raise MetadataFetchingException(f"Pipeline error for {paper.arxiv_id}: {e}") from e
 
-        return (download_success, parsed_paper)
+    def _build_parsed_paper(self, paper: ArxivPaper, pdf_content: Optional[PdfContent]) -> Optional[ParsedPaper]:
+        """
+        Combine a paper's arXiv metadata with its parsed PDF content.
+
+        Returns:
+            ParsedPaper, or None if the PDF could not be parsed
+        """
+        if not pdf_content:
+            # PDF parsing failed, but this is not critical - we can continue with metadata only
+            logger.warning(f"PDF parsing failed for {paper.arxiv_id}, continuing with metadata only")
+            return None
+
+        # Create ArxivMetadata from the paper
+        arxiv_metadata = ArxivMetadata(
+            title=paper.title,
+            authors=paper.authors,
+            abstract=paper.abstract,
+            arxiv_id=paper.arxiv_id,
+            categories=paper.categories,
+            published_date=paper.published_date,
+            pdf_url=paper.pdf_url,
+        )
+
+        # Combine into ParsedPaper
+        logger.debug(f"Parse complete: {paper.arxiv_id} - {len(pdf_content.raw_text)} chars extracted")
+        return ParsedPaper(arxiv_metadata=arxiv_metadata, pdf_content=pdf_content)
 
     def _serialize_parsed_content(self, parsed_paper: ParsedPaper) -> Dict[str, Any]:
         """Serialize ParsedPaper content for database storage.
@@ -15,6 +15,12 @@ class OllamaClient:
         """Initialize Ollama client with settings."""
         self.base_url = settings.ollama_host
         self.timeout = httpx.Timeout(float(settings.ollama_timeout))
+        # Persistent client so calls reuse pooled keep-alive connections
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+        )
 
     async def health_check(self) -> Dict[str, Any]:
         """
@@ -24,19 +30,18 @@ class OllamaClient:
             Dictionary with health status information
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Check version endpoint for health
-                response = await client.get(f"{self.base_url}/api/version")
-
-                if response.status_code == 200:
-                    version_data = response.json()
-                    return {
-                        "status": "healthy",
-                        "message": "Ollama service is running",
-                        "version": version_data.get("version", "unknown"),
-                    }
-                else:
-                    raise OllamaException(f"Ollama returned status {response.status_code}")
+            # Check version endpoint for health
+            response = await self._client.get("/api/version")
+
+            if response.status_code == 200:
+                version_data = response.json()
+                return {
+                    "status": "healthy",
+                    "message": "Ollama service is running",
+                    "version": version_data.get("version", "unknown"),
+                }
+            else:
+                raise OllamaException(f"Ollama returned status {response.status_code}")
 
         except httpx.ConnectError as e:
             raise OllamaConnectionError(f"Cannot connect to Ollama service: {e}")
@@ -55,14 +60,13 @@ class OllamaClient:
             List of model information dictionaries
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.base_url}/api/tags")
+            response = await self._client.get("/api/tags")
 
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get("models", [])
-                else:
-                    raise OllamaException(f"Failed to list models: {response.status_code}")
+            if response.status_code == 200:
+                data = response.json()
+                return data.get("models", [])
+            else:
+                raise OllamaException(f"Failed to list models: {response.status_code}")
 
         except httpx.ConnectError as e:
             raise OllamaConnectionError(f"Cannot connect to Ollama service: {e}")
@@ -87,15 +91,14 @@ class OllamaClient:
             Response dictionary or None if failed
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                data = {"model": model, "prompt": prompt, "stream": stream, **kwargs}
+            data = {"model": model, "prompt": prompt, "stream": stream, **kwargs}
 
-                response = await client.post(f"{self.base_url}/api/generate", json=data)
+            response = await self._client.post("/api/generate", json=data)
 
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    raise OllamaException(f"Generation failed: {response.status_code}")
+            if response.status_code == 200:
+                return response.json()
+            else:
+                raise OllamaException(f"Generation failed: {response.status_code}")
 
         except httpx.ConnectError as e:
             raise OllamaConnectionError(f"Cannot connect to Ollama service: {e}")
@@ -105,3 +108,15 @@ class OllamaClient:
             raise
         except Exception as e:
             raise OllamaException(f"Error generating with Ollama: {e}")
+
+    async def close(self):
+        """Close the HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
@@ -1,5 +1,21 @@
+from .async_client import AsyncOpenSearchClient
 from .client import OpenSearchClient
-from .factory import make_opensearch_client, make_opensearch_client_fresh
+from .factory import (
+    make_async_opensearch_client,
+    make_opensearch_client,
+    make_opensearch_client_fresh,
+    reset_async_opensearch_client,
+    reset_opensearch_client,
+)
 from .query_builder import QueryBuilder
 
-__all__ = ["OpenSearchClient", "make_opensearch_client", "make_opensearch_client_fresh", "QueryBuilder"]
+__all__ = [
+    "AsyncOpenSearchClient",
+    "OpenSearchClient",
+    "make_async_opensearch_client",
+    "make_opensearch_client",
+    "make_opensearch_client_fresh",
+    "reset_async_opensearch_client",
+    "reset_opensearch_client",
+    "QueryBuilder",
+]
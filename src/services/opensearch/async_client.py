@@ -0,0 +1,313 @@
+"""Async OpenSearch client for serving search from the FastAPI event loop."""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import orjson
+from opensearchpy import AsyncOpenSearch
+from opensearchpy.helpers import async_bulk
+from src.config import Settings
+
+from .client import (
+    SEARCH_FILTER_PATH,
+    SEARCH_FILTER_PATH_PARAM,
+    build_bm25_body,
+    build_hybrid_body,
+    build_vector_body,
+    needs_fuzzy_fallback,
+    parse_search_hits,
+    prepare_chunk_doc,
+    shard_cache_params,
+)
+from .index_config_hybrid import HYBRID_RRF_PIPELINE
+from .query_builder import build_category_warmup_query
+from .result_cache import SearchResultCache
+from .serializer import ORJSONSerializer
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncOpenSearchClient:
+    """Async counterpart of OpenSearchClient for search and indexing.
+
+    Mirrors the sync client's search and indexing API as coroutines so concurrent
+    requests share one event loop instead of blocking a worker thread each.
+    Index and pipeline setup stay on the sync client.
+    """
+
+    def __init__(self, host: str, settings: Settings):
+        self.host = host
+        self.settings = settings
+        self.index_name = f"{settings.opensearch.index_name}-{settings.opensearch.chunk_index_suffix}"
+
+        self.client = AsyncOpenSearch(
+            hosts=[host],
+            http_compress=True,
+            maxsize=settings.opensearch.pool_maxsize,
+            max_retries=3,
+            retry_on_timeout=True,
+            use_ssl=False,
+            verify_certs=False,
+            ssl_show_warn=False,
+            serializer=ORJSONSerializer(),
+        )
+
+        self._search_cache: Optional[SearchResultCache] = None
+        if settings.opensearch.result_cache_enabled:
+            self._search_cache = SearchResultCache(
+                maxsize=settings.opensearch.result_cache_size, ttl=settings.opensearch.result_cache_ttl_seconds
+            )
+
+        logger.info(f"Async OpenSearch client initialized with host: {host}")
+
+    async def close(self) -> None:
+        """Close the underlying connection pool."""
+        await self.client.close()
+
+    async def health_check(self) -> bool:
+        """Check if OpenSearch cluster is healthy."""
+        try:
+            health = await self.client.cluster.health()
+            return health["status"] in ["green", "yellow"]
+        except Exception as e:
+            logger.error(f"Health check failed: {e}")
+            return False
+
+    async def warm_category_filters(self, categories: Optional[List[str]] = None) -> int:
+        """Prime postings and the shard request cache for hot category filters.
+
+        Issues one size-0 search per category with request_cache enabled.
+
+        :param categories: Categories to warm (defaults to settings.opensearch.hot_categories)
+        :returns: Number of categories warmed successfully
+        """
+        if categories is None:
+            categories = self.settings.opensearch.hot_categories
+
+        warmed = 0
+        for category in categories:
+            try:
+                await self.client.search(
+                    index=self.index_name, body=build_category_warmup_query(category), params={"request_cache": "true"}
+                )
+                warmed += 1
+            except Exception as e:
+                logger.warning(f"Category warm-up failed for {category}: {e}")
+
+        logger.info(f"Warmed {warmed}/{len(categories)} category filters")
+        return warmed
+
+    async def search_papers(
+        self, query: str, size: int = 10, from_: int = 0, categories: Optional[List[str]] = None, latest: bool = True
+    ) -> Dict[str, Any]:
+        """BM25 search for papers."""
+        return await self._search_bm25_only(query=query, size=size, from_=from_, categories=categories, latest=latest)
+
+    async def search_papers_trimmed(
+        self, query: str, size: int = 10, from_: int = 0, categories: Optional[List[str]] = None, latest: bool = True
+    ) -> bytes:
+        """BM25 search returning OpenSearch's trimmed response as JSON instead of building hit dicts.
+
+        OpenSearch trims the response with SEARCH_FILTER_PATH (no shard stats or per-hit
+        metadata) and it keeps OpenSearch's hits format. The client still decodes it, which
+        the fuzzy fallback check needs, and it is re-encoded with orjson; what this saves is
+        the smaller payload and the per-hit dicts, not the JSON decoding. Like search_papers,
+        an exact search that matches nothing is retried with fuzzy matching; results are not
+        stored in the result cache.
+
+        :param query: Search query text
+        :param size: Number of results
+        :param from_: Offset for pagination
+        :param categories: Optional category filter
+        :param latest: Sort by date instead of relevance
+        :returns: Trimmed JSON response body
+        """
+        path = f"/{self.index_name}/_search"
+        params = {"filter_path": SEARCH_FILTER_PATH_PARAM, **shard_cache_params(query)}
+        body = build_bm25_body(query=query, size=size, from_=from_, categories=categories, latest=latest)
+        response = await self.client.transport.perform_request("POST", path, params=params, body=body)
+
+        if needs_fuzzy_fallback(response, query, self.settings):
+            fuzzy_body = build_bm25_body(query=query, size=size, from_=from_, categories=categories, latest=latest, fuzzy=True)
+            if fuzzy_body is not None:
+                logger.debug(f"No exact matches for '{query[:50]}', retrying with fuzzy matching")
+                response = await self.client.transport.perform_request("POST", path, params=params, body=fuzzy_body)
+
+        return orjson.dumps(response)
+
+    async def search_chunks_vector(
+        self, query_embedding: List[float], size: int = 10, categories: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Pure vector search on chunks.
+
+        :param query_embedding: Query embedding vector
+        :param size: Number of results
+        :param categories: Optional category filter
+        :returns: Search results
+        """
+        try:
+            search_body = build_vector_body(query_embedding, size, categories)
+            response = await self.client.search(index=self.index_name, body=search_body, filter_path=SEARCH_FILTER_PATH)
+            return parse_search_hits(response)
+
+        except Exception as e:
+            logger.error(f"Vector search error: {e}")
+            return {"total": 0, "hits": []}
+
+    async def search_unified(
+        self,
+        query: str,
+        query_embedding: Optional[List[float]] = None,
+        size: int = 10,
+        from_: int = 0,
+        categories: Optional[List[str]] = None,
+        latest: bool = False,
+        use_hybrid: bool = True,
+        min_score: float = 0.0,
+    ) -> Dict[str, Any]:
+        """Unified search method supporting BM25, vector, and hybrid modes.
+
+        :param query: Text query for search
+        :param query_embedding: Optional embedding for vector/hybrid search
+        :param size: Number of results to return
+        :param from_: Offset for pagination
+        :param categories: Optional category filter
+        :param latest: Sort by date instead of relevance
+        :param use_hybrid: If True and embedding provided, use hybrid search
+        :param min_score: Minimum score threshold
+        :returns: Search results
+        """
+        try:
+            if not query_embedding or not use_hybrid:
+                return await self._search_bm25_only(query=query, size=size, from_=from_, categories=categories, latest=latest)
+
+            return await self._search_hybrid_native(
+                query=query, query_embedding=query_embedding, size=size, categories=categories, min_score=min_score
+            )
+
+        except Exception as e:
+            logger.error(f"Unified search error: {e}")
+            return {"total": 0, "hits": []}
+
+    async def search_chunks_hybrid(
+        self,
+        query: str,
+        query_embedding: List[float],
+        size: int = 10,
+        categories: Optional[List[str]] = None,
+        min_score: float = 0.0,
+    ) -> Dict[str, Any]:
+        """Hybrid search combining BM25 and vector similarity using native RRF."""
+        return await self._search_hybrid_native(
+            query=query, query_embedding=query_embedding, size=size, categories=categories, min_score=min_score
+        )
+
+    async def _search_bm25_only(
+        self, query: str, size: int, from_: int, categories: Optional[List[str]], latest: bool
+    ) -> Dict[str, Any]:
+        """Pure BM25 search implementation."""
+        cache_key = SearchResultCache.make_key(query, size, from_, categories, latest)
+        if self._search_cache is not None:
+            cached = self._search_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"BM25 search cache hit for '{query[:50]}'")
+                return cached
+
+        search_body = build_bm25_body(query=query, size=size, from_=from_, categories=categories, latest=latest)
+
+        params = shard_cache_params(query)
+        response = await self.client.search(
+            index=self.index_name, body=search_body, params=params, filter_path=SEARCH_FILTER_PATH
+        )
+
+        if needs_fuzzy_fallback(response, query, self.settings):
+            fuzzy_body = build_bm25_body(query=query, size=size, from_=from_, categories=categories, latest=latest, fuzzy=True)
+            if fuzzy_body is not None:
+                logger.debug(f"No exact matches for '{query[:50]}', retrying with fuzzy matching")
+                response = await self.client.search(
+                    index=self.index_name, body=fuzzy_body, params=params, filter_path=SEARCH_FILTER_PATH
+                )
+
+        results = parse_search_hits(response)
+        logger.info(f"BM25 search for '{query[:50]}...' returned {results['total']} results")
+
+        if self._search_cache is not None:
+            self._search_cache.set(cache_key, results)
+        return results
+
+    async def _search_hybrid_native(
+        self, query: str, query_embedding: List[float], size: int, categories: Optional[List[str]], min_score: float
+    ) -> Dict[str, Any]:
+        """Native OpenSearch hybrid search with RRF pipeline."""
+        search_body = build_hybrid_body(query, query_embedding, size, categories)
+
+        response = await self.client.search(
+            index=self.index_name,
+            body=search_body,
+            params={"search_pipeline": HYBRID_RRF_PIPELINE["id"]},
+            filter_path=SEARCH_FILTER_PATH,
+        )
+
+        results = parse_search_hits(response, min_score=min_score)
+        logger.info(f"Native hybrid search for '{query[:50]}...' returned {results['total']} results")
+        return results
+
+    def _invalidate_search_cache(self) -> None:
+        """Drop cached search results after the index changes."""
+        if self._search_cache is not None:
+            self._search_cache.clear()
+
+    async def index_chunk(self, chunk_data: Dict[str, Any], embedding: List[float]) -> bool:
+        """Index a single chunk with its embedding.
+
+        :param chunk_data: Chunk data dictionary
+        :param embedding: Embedding vector
+        :returns: True if successful
+        """
+        try:
+            doc = prepare_chunk_doc(chunk_data, embedding)
+
+            response = await self.client.index(index=self.index_name, body=doc, refresh=False)
+            self._invalidate_search_cache()
+
+            return response["result"] in ["created", "updated"]
+
+        except Exception as e:
+            logger.error(f"Error indexing chunk: {e}")
+            return False
+
+    async def bulk_index_chunks(self, chunks: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Bulk index multiple chunks with embeddings.
+
+        :param chunks: List of dicts with 'chunk_data' and 'embedding'
+        :returns: Statistics
+        """
+        # One timestamp for the whole batch instead of one per document
+        now_iso = datetime.now(timezone.utc).isoformat()
+        actions = (
+            {
+                "_op_type": "index",
+                "_index": self.index_name,
+                "_source": prepare_chunk_doc(chunk["chunk_data"], chunk["embedding"], now_iso),
+            }
+            for chunk in chunks
+        )
+
+        try:
+            success, errors = await async_bulk(
+                self.client,
+                actions,
+                chunk_size=self.settings.opensearch.bulk_chunk_size,
+                max_chunk_bytes=self.settings.opensearch.bulk_max_chunk_bytes,
+                raise_on_error=False,
+                refresh=False,
+            )
+
+            self._invalidate_search_cache()
+            logger.info(f"Bulk indexed {success} chunks, {len(errors)} failed")
+            return {"success": success, "failed": len(errors)}
+
+        except Exception as e:
+            logger.error(f"Bulk chunk indexing error: {e}")
+            raise
@@ -1,32 +1,215 @@
 """Unified OpenSearch client supporting both simple BM25 and hybrid search."""
 
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
 
-from opensearchpy import OpenSearch
+import orjson
+from opensearchpy import OpenSearch, helpers
 from src.config import Settings
 
 from .index_config_hybrid import ARXIV_PAPERS_CHUNKS_MAPPING, HYBRID_RRF_PIPELINE
-from .query_builder import QueryBuilder
+from .query_builder import QueryBuilder, build_category_filter, build_category_warmup_query
+from .result_cache import SearchResultCache
+from .serializer import ORJSONSerializer
 
 logger = logging.getLogger(__name__)
 
+# Only the response fields the search methods read; strips shard stats and per-hit metadata server-side
+SEARCH_FILTER_PATH = ["hits.total.value", "hits.hits._id", "hits.hits._score", "hits.hits._source", "hits.hits.highlight"]
+SEARCH_FILTER_PATH_PARAM = ",".join(SEARCH_FILTER_PATH)
+
+
+def shard_cache_params(query: str) -> Dict[str, str]:
+    """Search params that route identical queries to the same shard copies and use the shard request cache.
+
+    :param query: Search query text
+    :returns: Query-string params for the search request
+    """
+    return {"preference": hashlib.md5(query.encode("utf-8"), usedforsecurity=False).hexdigest(), "request_cache": "true"}
+
+
+def build_bm25_body(
+    query: str, size: int, from_: int, categories: Optional[List[str]], latest: bool, fuzzy: bool = False
+) -> Optional[Dict[str, Any]]:
+    """Build a BM25 chunk search body.
+
+    :param query: Search query text
+    :param size: Number of results
+    :param from_: Offset for pagination
+    :param categories: Optional category filter
+    :param latest: Sort by date instead of relevance
+    :param fuzzy: Build the fuzzy variant used as a fallback
+    :returns: Search body, or None when fuzzy was requested but the query is too long for it
+    """
+    builder = QueryBuilder(
+        query=query, size=size, from_=from_, categories=categories, latest_papers=latest, search_chunks=True, fuzzy=fuzzy
+    )
+    if fuzzy and not builder.fuzzy:
+        return None
+    return builder.build()
+
+
+def needs_fuzzy_fallback(response: Dict[str, Any], query: str, settings: Settings) -> bool:
+    """Whether an exact BM25 search came back empty and should be retried with fuzzy matching.
+
+    Exact matching runs first; fuzzy expansion is only paid for when nothing matched.
+    """
+    return response["hits"]["total"]["value"] == 0 and settings.opensearch.fuzzy_fallback_enabled and bool(query.strip())
+
+
+def build_vector_body(query_embedding: List[float], size: int, categories: Optional[List[str]]) -> Dict[str, Any]:
+    """Build a pure k-NN chunk search body.
+
+    :param query_embedding: Query embedding vector
+    :param size: Number of results
+    :param categories: Optional category filter
+    :returns: Search body
+    """
+    search_body = {
+        "size": size,
+        "query": {"knn": {"embedding": {"vector": query_embedding, "k": size}}},
+        "_source": {"excludes": ["embedding"]},
+    }
+
+    if categories:
+        search_body["query"] = {"bool": {"must": [search_body["query"]], "filter": [build_category_filter(categories)]}}
+    return search_body
+
+
+def build_hybrid_body(query: str, query_embedding: List[float], size: int, categories: Optional[List[str]]) -> Dict[str, Any]:
+    """Build a hybrid BM25 + k-NN search body for the RRF search pipeline.
+
+    :param query: Search query text
+    :param query_embedding: Query embedding vector
+    :param size: Number of results
+    :param categories: Optional category filter
+    :returns: Search body
+    """
+    bm25_search_body = build_bm25_body(query=query, size=size * 2, from_=0, categories=categories, latest=False)
+
+    hybrid_query = {
+        "hybrid": {"queries": [bm25_search_body["query"], {"knn": {"embedding": {"vector": query_embedding, "k": size * 2}}}]}
+    }
+
+    return {
+        "size": size,
+        "query": hybrid_query,
+        "_source": bm25_search_body["_source"],
+        "highlight": bm25_search_body["highlight"],
+    }
+
+
+def parse_search_hits(response: Dict[str, Any], min_score: Optional[float] = None) -> Dict[str, Any]:
+    """Turn a search response (trimmed with SEARCH_FILTER_PATH) into the results dict the API returns.
+
+    :param response: OpenSearch search response
+    :param min_score: Drop hits scoring below this; total then counts the kept hits
+    :returns: Dict with 'total' and 'hits' (chunk sources with score, chunk_id and highlights)
+    """
+    results = {"total": response["hits"]["total"]["value"], "hits": []}
+
+    for hit in response["hits"].get("hits", []):
+        if min_score is not None and hit["_score"] < min_score:
+            continue
+
+        chunk = hit["_source"]
+        # Date-sorted searches are not scored, so OpenSearch returns a null _score
+        chunk["score"] = hit["_score"] or 0.0
+        chunk["chunk_id"] = hit["_id"]
+
+        if "highlight" in hit:
+            chunk["highlights"] = hit["highlight"]
+
+        results["hits"].append(chunk)
+
+    if min_score is not None:
+        results["total"] = len(results["hits"])
+    return results
+
+
+def prepare_chunk_doc(chunk_data: Dict[str, Any], embedding: List[float], now_iso: Optional[str] = None) -> Dict[str, Any]:
+    """Build the document body for a chunk without mutating the caller's dict.
+
+    :param chunk_data: Chunk data dictionary
+    :param embedding: Embedding vector
+    :param now_iso: Precomputed UTC timestamp shared across a batch; computed per call if omitted
+    :returns: Document ready for indexing
+    """
+    if now_iso is None:
+        now_iso = datetime.now(timezone.utc).isoformat()
+
+    doc = dict(chunk_data)
+    doc["embedding"] = embedding
+    doc.setdefault("created_at", now_iso)
+    doc["updated_at"] = now_iso
+    return doc
+
 
 class OpenSearchClient:
     """OpenSearch client supporting BM25 and hybrid search with native RRF."""
 
-    def __init__(self, host: str, settings: Settings):
+    def __init__(
+        self,
+        host: str,
+        settings: Settings,
+        thread_count: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        max_chunk_bytes: Optional[int] = None,
+        queue_size: Optional[int] = None,
+    ):
+        """Initialize OpenSearch client.
+
+        Bulk indexing parameters default to the values in settings.opensearch.
+
+        :param host: OpenSearch host URL
+        :param settings: Application settings
+        :param thread_count: Threads used by parallel_bulk
+        :param chunk_size: Documents per _bulk request
+        :param max_chunk_bytes: Maximum size of a single _bulk request body
+        :param queue_size: Pending _bulk requests buffered for the thread pool
+        """
         self.host = host
         self.settings = settings
         self.index_name = f"{settings.opensearch.index_name}-{settings.opensearch.chunk_index_suffix}"
 
+        self.thread_count = thread_count or settings.opensearch.bulk_thread_count
+        self.chunk_size = chunk_size or settings.opensearch.bulk_chunk_size
+        self.max_chunk_bytes = max_chunk_bytes or settings.opensearch.bulk_max_chunk_bytes
+        self.queue_size = queue_size or settings.opensearch.bulk_queue_size
+
         self.client = OpenSearch(
             hosts=[host],
+            http_compress=True,  # gzip request bodies and ask for gzip responses
+            # Keep enough pooled connections for concurrent searches and parallel_bulk threads
+            pool_maxsize=max(settings.opensearch.pool_maxsize, 2 * self.thread_count),
+            max_retries=3,
+            retry_on_timeout=True,
             use_ssl=False,
             verify_certs=False,
             ssl_show_warn=False,
+            serializer=ORJSONSerializer(),
         )
 
+        self._search_cache: Optional[SearchResultCache] = None
+        if settings.opensearch.result_cache_enabled:
+            self._search_cache = SearchResultCache(
+                maxsize=settings.opensearch.result_cache_size, ttl=settings.opensearch.result_cache_ttl_seconds
+            )
+
+        # The index only appears or disappears through _create_hybrid_index, so a
+        # positive existence check is remembered until then (or until a stats call fails)
+        self._index_exists = False
+
+        # Concurrent bulk loads share one refresh-interval switch; the first saves the index's
+        # interval and the last restores it
+        self._load_mode_lock = threading.Lock()
+        self._load_mode_depth = 0
+        self._saved_refresh_interval: Optional[str] = None
+
         logger.info(f"OpenSearch client initialized with host: {host}")
 
     def health_check(self) -> bool:
@@ -38,10 +221,43 @@ class OpenSearchClient:
             logger.error(f"Health check failed: {e}")
             return False
 
+    def warm_category_filters(self, categories: Optional[List[str]] = None) -> int:
+        """Prime postings and the shard request cache for hot category filters.
+
+        Issues one size-0 search per category with request_cache enabled.
+
+        :param categories: Categories to warm (defaults to settings.opensearch.hot_categories)
+        :returns: Number of categories warmed successfully
+        """
+        if categories is None:
+            categories = self.settings.opensearch.hot_categories
+
+        warmed = 0
+        for category in categories:
+            try:
+                self.client.search(
+                    index=self.index_name, body=build_category_warmup_query(category), params={"request_cache": "true"}
+                )
+                warmed += 1
+            except Exception as e:
+                logger.warning(f"Category warm-up failed for {category}: {e}")
+
+        logger.info(f"Warmed {warmed}/{len(categories)} category filters")
+        return warmed
+
+    def _check_index_exists(self) -> bool:
+        """Check whether the hybrid index exists, skipping the round-trip once it is known to.
+
+        :returns: True if the index exists
+        """
+        if not self._index_exists:
+            self._index_exists = bool(self.client.indices.exists(index=self.index_name))
+        return self._index_exists
+
     def get_index_stats(self) -> Dict[str, Any]:
         """Get statistics for the hybrid index."""
         try:
-            if not self.client.indices.exists(index=self.index_name):
+            if not self._check_index_exists():
                 return {"index_name": self.index_name, "exists": False, "document_count": 0}
 
             stats_response = self.client.indices.stats(index=self.index_name)
@@ -56,6 +272,7 @@ class OpenSearchClient:
             }
 
         except Exception as e:
+            self._index_exists = False
             logger.error(f"Error getting index stats: {e}")
             return {"index_name": self.index_name, "exists": False, "document_count": 0, "error": str(e)}
 
@@ -72,16 +289,20 @@ class OpenSearchClient:
         :param force: If True, recreate index even if it exists
         :returns: True if created, False if already exists
         """
+        self._index_exists = False
+
         try:
             if force and self.client.indices.exists(index=self.index_name):
                 self.client.indices.delete(index=self.index_name)
                 logger.info(f"Deleted existing hybrid index: {self.index_name}")
 
             if not self.client.indices.exists(index=self.index_name):
-                self.client.indices.create(index=self.index_name, body=ARXIV_PAPERS_CHUNKS_MAPPING)
+                self.client.indices.create(index=self.index_name, body=self._build_index_body())
+                self._index_exists = True
                 logger.info(f"Created hybrid index: {self.index_name}")
                 return True
 
+            self._index_exists = True
             logger.info(f"Hybrid index already exists: {self.index_name}")
             return False
 
@@ -89,6 +310,23 @@ class OpenSearchClient:
             logger.error(f"Error creating hybrid index: {e}")
             raise
 
+    def _build_index_body(self) -> Dict[str, Any]:
+        """Build the index creation body with shard, refresh and translog settings applied.
+
+        :returns: Index settings and mappings
+        """
+        opensearch_settings = self.settings.opensearch
+        index_settings = {
+            **ARXIV_PAPERS_CHUNKS_MAPPING["settings"],
+            "number_of_shards": opensearch_settings.number_of_shards,
+            "refresh_interval": opensearch_settings.refresh_interval,
+            "translog": {
+                "flush_threshold_size": opensearch_settings.translog_flush_threshold,
+                "durability": opensearch_settings.translog_durability,
+            },
+        }
+        return {**ARXIV_PAPERS_CHUNKS_MAPPING, "settings": index_settings}
+
     def _create_rrf_pipeline(self, force: bool = False) -> bool:
         """Create RRF search pipeline for native hybrid search.
 
@@ -132,6 +370,38 @@ class OpenSearchClient:
         """BM25 search for papers."""
         return self._search_bm25_only(query=query, size=size, from_=from_, categories=categories, latest=latest)
 
+    def search_papers_trimmed(
+        self, query: str, size: int = 10, from_: int = 0, categories: Optional[List[str]] = None, latest: bool = True
+    ) -> bytes:
+        """BM25 search returning OpenSearch's trimmed response as JSON instead of building hit dicts.
+
+        OpenSearch trims the response with SEARCH_FILTER_PATH (no shard stats or per-hit
+        metadata) and it keeps OpenSearch's hits format. The client still decodes it, which
+        the fuzzy fallback check needs, and it is re-encoded with orjson; what this saves is
+        the smaller payload and the per-hit dicts, not the JSON decoding. Like search_papers,
+        an exact search that matches nothing is retried with fuzzy matching; results are not
+        stored in the result cache.
+
+        :param query: Search query text
+        :param size: Number of results
+        :param from_: Offset for pagination
+        :param categories: Optional category filter
+        :param latest: Sort by date instead of relevance
+        :returns: Trimmed JSON response body
+        """
+        path = f"/{self.index_name}/_search"
+        params = {"filter_path": SEARCH_FILTER_PATH_PARAM, **shard_cache_params(query)}
+        body = build_bm25_body(query=query, size=size, from_=from_, categories=categories, latest=latest)
+        response = self.client.transport.perform_request("POST", path, params=params, body=body)
+
+        if needs_fuzzy_fallback(response, query, self.settings):
+            fuzzy_body = build_bm25_body(query=query, size=size, from_=from_, categories=categories, latest=latest, fuzzy=True)
+            if fuzzy_body is not None:
+                logger.debug(f"No exact matches for '{query[:50]}', retrying with fuzzy matching")
+                response = self.client.transport.perform_request("POST", path, params=params, body=fuzzy_body)
+
+        return orjson.dumps(response)
+
     def search_chunks_vector(
         self, query_embedding: List[float], size: int = 10, categories: Optional[List[str]] = None
     ) -> Dict[str, Any]:
@@ -143,31 +413,9 @@ class OpenSearchClient:
         :returns: Search results
         """
         try:
-            # Build filter
-            filter_clause = []
-            if categories:
-                filter_clause.append({"terms": {"categories": categories}})
-
-            search_body = {
-                "size": size,
-                "query": {"knn": {"embedding": {"vector": query_embedding, "k": size}}},
-                "_source": {"excludes": ["embedding"]},
-            }
-
-            if filter_clause:
-                search_body["query"] = {"bool": {"must": [search_body["query"]], "filter": filter_clause}}
-
-            response = self.client.search(index=self.index_name, body=search_body)
-
-            results = {"total": response["hits"]["total"]["value"], "hits": []}
-
-            for hit in response["hits"]["hits"]:
-                chunk = hit["_source"]
-                chunk["score"] = hit["_score"]
-                chunk["chunk_id"] = hit["_id"]
-                results["hits"].append(chunk)
-
-            return results
+            search_body = build_vector_body(query_embedding, size, categories)
+            response = self.client.search(index=self.index_name, body=search_body, filter_path=SEARCH_FILTER_PATH)
+            return parse_search_hits(response)
 
         except Exception as e:
             logger.error(f"Vector search error: {e}")
@@ -214,74 +462,48 @@ class OpenSearchClient:
         self, query: str, size: int, from_: int, categories: Optional[List[str]], latest: bool
     ) -> Dict[str, Any]:
         """Pure BM25 search implementation."""
-        builder = QueryBuilder(
-            query=query,
-            size=size,
-            from_=from_,
-            categories=categories,
-            latest_papers=latest,
-            search_chunks=True,  # Enable chunk search mode
-        )
-        search_body = builder.build()
-
-        response = self.client.search(index=self.index_name, body=search_body)
-
-        results = {"total": response["hits"]["total"]["value"], "hits": []}
-
-        for hit in response["hits"]["hits"]:
-            chunk = hit["_source"]
-            chunk["score"] = hit["_score"]
-            chunk["chunk_id"] = hit["_id"]
-
-            if "highlight" in hit:
-                chunk["highlights"] = hit["highlight"]
-
-            results["hits"].append(chunk)
-
+        cache_key = SearchResultCache.make_key(query, size, from_, categories, latest)
+        if self._search_cache is not None:
+            cached = self._search_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"BM25 search cache hit for '{query[:50]}'")
+                return cached
+
+        search_body = build_bm25_body(query=query, size=size, from_=from_, categories=categories, latest=latest)
+
+        params = shard_cache_params(query)
+        response = self.client.search(index=self.index_name, body=search_body, params=params, filter_path=SEARCH_FILTER_PATH)
+
+        if needs_fuzzy_fallback(response, query, self.settings):
+            fuzzy_body = build_bm25_body(query=query, size=size, from_=from_, categories=categories, latest=latest, fuzzy=True)
+            if fuzzy_body is not None:
+                logger.debug(f"No exact matches for '{query[:50]}', retrying with fuzzy matching")
+                response = self.client.search(
+                    index=self.index_name, body=fuzzy_body, params=params, filter_path=SEARCH_FILTER_PATH
+                )
+
+        results = parse_search_hits(response)
         logger.info(f"BM25 search for '{query[:50]}...' returned {results['total']} results")
+
+        if self._search_cache is not None:
+            self._search_cache.set(cache_key, results)
         return results
 
     def _search_hybrid_native(
         self, query: str, query_embedding: List[float], size: int, categories: Optional[List[str]], min_score: float
     ) -> Dict[str, Any]:
         """Native OpenSearch hybrid search with RRF pipeline."""
-        builder = QueryBuilder(
-            query=query, size=size * 2, from_=0, categories=categories, latest_papers=False, search_chunks=True
-        )
-        bm25_search_body = builder.build()
-
-        bm25_query = bm25_search_body["query"]
-
-        hybrid_query = {"hybrid": {"queries": [bm25_query, {"knn": {"embedding": {"vector": query_embedding, "k": size * 2}}}]}}
-
-        search_body = {
-            "size": size,
-            "query": hybrid_query,
-            "_source": bm25_search_body["_source"],
-            "highlight": bm25_search_body["highlight"],
-        }
+        search_body = build_hybrid_body(query, query_embedding, size, categories)
 
         # Execute search with RRF pipeline
         response = self.client.search(
-            index=self.index_name, body=search_body, params={"search_pipeline": HYBRID_RRF_PIPELINE["id"]}
+            index=self.index_name,
+            body=search_body,
+            params={"search_pipeline": HYBRID_RRF_PIPELINE["id"]},
+            filter_path=SEARCH_FILTER_PATH,
         )
 
-        results = {"total": response["hits"]["total"]["value"], "hits": []}
-
-        for hit in response["hits"]["hits"]:
-            if hit["_score"] < min_score:
-                continue
-
-            chunk = hit["_source"]
-            chunk["score"] = hit["_score"]
-            chunk["chunk_id"] = hit["_id"]
-
-            if "highlight" in hit:
-                chunk["highlights"] = hit["highlight"]
-
-            results["hits"].append(chunk)
-
-        results["total"] = len(results["hits"])
+        results = parse_search_hits(response, min_score=min_score)
         logger.info(f"Native hybrid search for '{query[:50]}...' returned {results['total']} results")
         return results
 
@@ -298,6 +520,11 @@ class OpenSearchClient:
             query=query, query_embedding=query_embedding, size=size, categories=categories, min_score=min_score
         )
 
+    def _invalidate_search_cache(self) -> None:
+        """Drop cached search results after the index changes."""
+        if self._search_cache is not None:
+            self._search_cache.clear()
+
     def index_chunk(self, chunk_data: Dict[str, Any], embedding: List[float]) -> bool:
         """Index a single chunk with its embedding.
 
@@ -306,9 +533,10 @@ class OpenSearchClient:
         :returns: True if successful
         """
         try:
-            chunk_data["embedding"] = embedding
+            doc = prepare_chunk_doc(chunk_data, embedding)
 
-            response = self.client.index(index=self.index_name, body=chunk_data, refresh=True)
+            response = self.client.index(index=self.index_name, body=doc, refresh=False)
+            self._invalidate_search_cache()
 
             return response["result"] in ["created", "updated"]
 
@@ -316,27 +544,86 @@ class OpenSearchClient:
             logger.error(f"Error indexing chunk: {e}")
             return False
 
+    @contextmanager
+    def _bulk_load_mode(self) -> Iterator[None]:
+        """Disable periodic refreshes while a large load runs.
+
+        Overlapping loads on this client are reference-counted: the first one reads the
+        index's current refresh interval before disabling refreshes, and the last one
+        restores that value and refreshes once so the loaded documents become searchable.
+        """
+        with self._load_mode_lock:
+            if self._load_mode_depth == 0:
+                self._saved_refresh_interval = self._get_refresh_interval()
+                self.client.indices.put_settings(index=self.index_name, body={"index": {"refresh_interval": "-1"}})
+            self._load_mode_depth += 1
+        try:
+            yield
+        finally:
+            with self._load_mode_lock:
+                self._load_mode_depth -= 1
+                if self._load_mode_depth == 0:
+                    # None removes the override, which puts an index without an explicit interval back on the default
+                    self.client.indices.put_settings(
+                        index=self.index_name, body={"index": {"refresh_interval": self._saved_refresh_interval}}
+                    )
+                    self.client.indices.refresh(index=self.index_name)
+
+    def _get_refresh_interval(self) -> Optional[str]:
+        """Read the refresh interval currently set on the index.
+
+        :returns: The index's refresh_interval, or None if it uses the cluster default
+        """
+        response = self.client.indices.get_settings(index=self.index_name, name="index.refresh_interval", flat_settings=True)
+        index_settings = next(iter(response.values()), {}).get("settings", {})
+        return index_settings.get("index.refresh_interval")
+
     def bulk_index_chunks(self, chunks: List[Dict[str, Any]]) -> Dict[str, int]:
         """Bulk index multiple chunks with embeddings.
 
+        Documents are streamed to OpenSearch in batched _bulk requests sent from a
+        thread pool (parallel_bulk), and no refresh is forced per batch.
+
         :param chunks: List of dicts with 'chunk_data' and 'embedding'
         :returns: Statistics
         """
-        from opensearchpy import helpers
 
-        try:
-            actions = []
-            for chunk in chunks:
-                chunk_data = chunk["chunk_data"].copy()
-                chunk_data["embedding"] = chunk["embedding"]
+        # One timestamp for the whole batch instead of one per document
+        now_iso = datetime.now(timezone.utc).isoformat()
 
-                action = {"_index": self.index_name, "_source": chunk_data}
-                actions.append(action)
+        def actions():
+            for chunk in chunks:
+                yield {
+                    "_op_type": "index",
+                    "_index": self.index_name,
+                    "_source": prepare_chunk_doc(chunk["chunk_data"], chunk["embedding"], now_iso),
+                }
 
-            success, failed = helpers.bulk(self.client, actions, refresh=True)
+        # Only large loads are worth toggling the index refresh interval for
+        load_mode = self._bulk_load_mode() if len(chunks) >= self.chunk_size else nullcontext()
 
-            logger.info(f"Bulk indexed {success} chunks, {len(failed)} failed")
-            return {"success": success, "failed": len(failed)}
+        try:
+            success, failed = 0, 0
+            with load_mode:
+                for ok, item in helpers.parallel_bulk(
+                    self.client,
+                    actions(),
+                    thread_count=self.thread_count,
+                    chunk_size=self.chunk_size,
+                    max_chunk_bytes=self.max_chunk_bytes,
+                    queue_size=self.queue_size,
+                    raise_on_error=False,
+                    refresh=False,
+                ):
+                    if ok:
+                        success += 1
+                    else:
+                        failed += 1
+                        logger.debug(f"Failed to index chunk: {item}")
+
+            self._invalidate_search_cache()
+            logger.info(f"Bulk indexed {success} chunks, {failed} failed")
+            return {"success": success, "failed": failed}
 
         except Exception as e:
             logger.error(f"Bulk chunk indexing error: {e}")
@@ -354,6 +641,7 @@ class OpenSearchClient:
             )
 
             deleted = response.get("deleted", 0)
+            self._invalidate_search_cache()
             logger.info(f"Deleted {deleted} chunks for paper {arxiv_id}")
             return deleted > 0
 
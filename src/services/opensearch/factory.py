@@ -1,26 +1,45 @@
 """Unified factory for OpenSearch client."""
 
-from functools import lru_cache
+import threading
 from typing import Optional
 
 from src.config import Settings, get_settings
 
+from .async_client import AsyncOpenSearchClient
 from .client import OpenSearchClient
 
+_client: Optional[OpenSearchClient] = None
+_client_lock = threading.Lock()
 
-@lru_cache(maxsize=1)
-def make_opensearch_client(settings: Optional[Settings] = None) -> OpenSearchClient:
-    """Factory function to create cached OpenSearch client.
+_async_client: Optional[AsyncOpenSearchClient] = None
+_async_client_lock = threading.Lock()
 
-    Uses lru_cache to maintain a singleton instance for efficiency.
 
-    :param settings: Optional settings instance
-    :returns: Cached OpenSearchClient instance
+def make_opensearch_client() -> OpenSearchClient:
+    """Factory function to get the process-wide OpenSearch client.
+
+    The client is created once and reused so every caller shares the same
+    connection pool.
+
+    :returns: Shared OpenSearchClient instance
     """
-    if settings is None:
-        settings = get_settings()
+    global _client
 
-    return OpenSearchClient(host=settings.opensearch.host, settings=settings)
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                settings = get_settings()
+                _client = OpenSearchClient(host=settings.opensearch.host, settings=settings)
+
+    return _client
+
+
+def reset_opensearch_client() -> None:
+    """Drop the shared OpenSearch client so the next call builds a new one (for tests)."""
+    global _client
+
+    with _client_lock:
+        _client = None
 
 
 def make_opensearch_client_fresh(settings: Optional[Settings] = None, host: Optional[str] = None) -> OpenSearchClient:
@@ -40,3 +59,35 @@ def make_opensearch_client_fresh(settings: Optional[Settings] = None, host: Opti
     opensearch_host = host or settings.opensearch.host
 
     return OpenSearchClient(host=opensearch_host, settings=settings)
+
+
+def make_async_opensearch_client() -> AsyncOpenSearchClient:
+    """Factory function to get the process-wide async OpenSearch client.
+
+    Like make_opensearch_client, the client is created once and reused so every caller
+    shares the same connection pool. Its connections belong to the event loop that first
+    uses them, so the API creates it in its lifespan and closes it with
+    reset_async_opensearch_client on shutdown.
+
+    :returns: Shared AsyncOpenSearchClient instance
+    """
+    global _async_client
+
+    if _async_client is None:
+        with _async_client_lock:
+            if _async_client is None:
+                settings = get_settings()
+                _async_client = AsyncOpenSearchClient(host=settings.opensearch.host, settings=settings)
+
+    return _async_client
+
+
+async def reset_async_opensearch_client() -> None:
+    """Close and drop the shared async OpenSearch client so the next call builds a new one."""
+    global _async_client
+
+    with _async_client_lock:
+        client, _async_client = _async_client, None
+
+    if client is not None:
+        await client.close()
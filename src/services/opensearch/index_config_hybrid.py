@@ -9,8 +9,14 @@ ARXIV_PAPERS_CHUNKS_INDEX = "arxiv-papers-chunks"
 # Index mapping for chunked papers with vector embeddings
 ARXIV_PAPERS_CHUNKS_MAPPING = {
     "settings": {
-        "number_of_shards": 1,
+        "number_of_shards": 2,
         "number_of_replicas": 0,
+        # Ingestion-oriented defaults: fewer refreshes and translog flushes mean fewer
+        # segments and merges, at the cost of new chunks taking up to refresh_interval
+        # to become searchable and async translog losing up to 5s of acked writes on a
+        # node crash. Overridden from settings.opensearch when the index is created.
+        "refresh_interval": "30s",
+        "translog": {"flush_threshold_size": "1gb", "durability": "async"},
         "index.knn": True,
         "index.knn.space_type": "cosinesimil",
         "analysis": {
@@ -58,7 +64,8 @@ ARXIV_PAPERS_CHUNKS_MAPPING = {
                 "analyzer": "standard_analyzer",
                 "fields": {"keyword": {"type": "keyword", "ignore_above": 256}},
             },
-            "abstract": {"type": "text", "analyzer": "text_analyzer"},
+            # Repeated on every chunk of a paper and never phrase-searched: skip positions
+            "abstract": {"type": "text", "analyzer": "text_analyzer", "index_options": "freqs"},
             "categories": {"type": "keyword"},
             "published_date": {"type": "date"},
             "section_title": {"type": "keyword"},
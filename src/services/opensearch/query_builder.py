@@ -1,8 +1,120 @@
 import logging
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Invariant query sections, built once and shared by reference.
+# The OpenSearch client only serializes request bodies, so these are never mutated.
+_DEFAULT_CHUNK_FIELDS = ("chunk_text^3", "title^2", "abstract^1")
+_DEFAULT_PAPER_FIELDS = ("title^3", "abstract^2", "authors^1")
+
+_SOURCE_CHUNKS = {"excludes": ["embedding"]}
+_SOURCE_PAPERS = ["arxiv_id", "title", "authors", "abstract", "categories", "published_date", "pdf_url"]
+
+_HIGHLIGHT_CHUNKS = {
+    "fields": {
+        "chunk_text": {
+            "fragment_size": 150,
+            "number_of_fragments": 2,
+            "pre_tags": ["<mark>"],
+            "post_tags": ["</mark>"],
+        },
+        "title": {"fragment_size": 0, "number_of_fragments": 0, "pre_tags": ["<mark>"], "post_tags": ["</mark>"]},
+        "abstract": {
+            "fragment_size": 150,
+            "number_of_fragments": 1,
+            "pre_tags": ["<mark>"],
+            "post_tags": ["</mark>"],
+        },
+    },
+    "require_field_match": False,
+}
+
+_HIGHLIGHT_PAPERS = {
+    "fields": {
+        "title": {
+            "fragment_size": 0,
+            "number_of_fragments": 0,
+        },
+        "abstract": {
+            "fragment_size": 150,
+            "number_of_fragments": 3,
+            "pre_tags": ["<mark>"],
+            "post_tags": ["</mark>"],
+        },
+        "authors": {
+            "fragment_size": 0,
+            "number_of_fragments": 0,
+            "pre_tags": ["<mark>"],
+            "post_tags": ["</mark>"],
+        },
+    },
+    "require_field_match": False,
+}
+
+# Fuzzy expansion builds an automaton per term, so it is only allowed on short queries
+_FUZZY_MAX_QUERY_CHARS = 64
+_FUZZY_MAX_QUERY_SPACES = 4
+
+# Body pieces for the empty-query, unfiltered listing ("latest papers" home page)
+_MATCH_ALL_QUERY = {"bool": {"must": [{"match_all": {}}]}}
+# No _score tiebreaker: date-ordered listings skip scoring entirely
+_LATEST_SORT = [{"published_date": {"order": "desc"}}]
+
+
+@lru_cache(maxsize=1024)
+def _build_multi_match(query: str, fields: Tuple[str, ...], fuzzy: bool) -> Dict[str, Any]:
+    """Build (and memoize) the multi_match clause for a query and field set.
+
+    :param query: Search query text
+    :param fields: Fields to search in, with optional boosts
+    :param fuzzy: Whether to allow fuzzy term matching
+    :returns: Multi-match query for text search
+    """
+    multi_match = {
+        "query": query,
+        "fields": fields,
+        "type": "best_fields",
+        "operator": "or",
+    }
+
+    if fuzzy:
+        multi_match["fuzziness"] = "AUTO"
+        multi_match["prefix_length"] = 2
+
+    return {"multi_match": multi_match}
+
+
+def _fuzzy_allowed(query: str) -> bool:
+    """Cheap check that a query is short enough for fuzzy expansion to stay affordable."""
+    return len(query) <= _FUZZY_MAX_QUERY_CHARS and query.count(" ") <= _FUZZY_MAX_QUERY_SPACES
+
+
+def build_category_filter(categories: List[str]) -> Dict[str, Any]:
+    """Build the category filter clause shared by searches and cache warm-up.
+
+    Wrapped in constant_score so it is never scored and OpenSearch can keep it as a
+    cached per-segment bitset; the name shows up in profile output for verification.
+
+    :param categories: Categories to filter by
+    :returns: Filter clause
+    """
+    return {"constant_score": {"filter": {"terms": {"categories": categories}}, "_name": "categories_filter"}}
+
+
+def build_category_warmup_query(category: str) -> Dict[str, Any]:
+    """Build a size-0 search that touches one category's postings and primes the request cache.
+
+    :param category: Category to warm, e.g. "cs.LG"
+    :returns: Search body with the category filter and a terms aggregation
+    """
+    return {
+        "size": 0,
+        "query": {"bool": {"filter": [build_category_filter([category])]}},
+        "aggs": {"categories": {"terms": {"field": "categories", "size": 10}}},
+    }
+
 
 class QueryBuilder:
     """
@@ -21,6 +133,7 @@ class QueryBuilder:
         track_total_hits: bool = True,
         latest_papers: bool = False,
         search_chunks: bool = False,
+        fuzzy: bool = False,
     ):
         """Initialize query builder.
 
@@ -32,6 +145,7 @@ class QueryBuilder:
         :param track_total_hits: Whether to track total hits accurately
         :param latest_papers: Sort by publication date instead of relevance
         :param search_chunks: Whether searching chunks (True) or papers (False)
+        :param fuzzy: Allow fuzzy term matching (only applied to short queries)
         """
         self.query = query
         self.size = size
@@ -40,20 +154,21 @@ class QueryBuilder:
         self.track_total_hits = track_total_hits
         self.latest_papers = latest_papers
         self.search_chunks = search_chunks
+        self.fuzzy = fuzzy and _fuzzy_allowed(query)
 
         if fields is None:
-            if search_chunks:
-                self.fields = ["chunk_text^3", "title^2", "abstract^1"]
-            else:
-                self.fields = ["title^3", "abstract^2", "authors^1"]
+            self.fields = _DEFAULT_CHUNK_FIELDS if search_chunks else _DEFAULT_PAPER_FIELDS
         else:
-            self.fields = fields
+            self.fields = tuple(fields)
 
     def build(self) -> Dict[str, Any]:
         """Build the complete OpenSearch query.
 
         :returns: Complete query dictionary ready for OpenSearch
         """
+        if not self.categories and not self.query.strip():
+            return self._build_latest_listing()
+
         query_body = {
             "query": self._build_query(),
             "size": self.size,
@@ -69,17 +184,37 @@ class QueryBuilder:
 
         return query_body
 
+    def _build_latest_listing(self) -> Dict[str, Any]:
+        """Build the empty-query, unfiltered body from shared invariant sections.
+
+        Equivalent to the general path, which always sorts by date when there is no query text.
+
+        :returns: Complete query dictionary ready for OpenSearch
+        """
+        return {
+            "query": _MATCH_ALL_QUERY,
+            "size": self.size,
+            "from": self.from_,
+            "track_total_hits": self.track_total_hits,
+            "_source": _SOURCE_CHUNKS if self.search_chunks else _SOURCE_PAPERS,
+            "highlight": _HIGHLIGHT_CHUNKS if self.search_chunks else _HIGHLIGHT_PAPERS,
+            "sort": _LATEST_SORT,
+        }
+
     def _build_query(self) -> Dict[str, Any]:
         """Build the main query with filters.
 
         :returns: Query dictionary with bool structure
         """
         must_clauses = []
+        filter_clauses = self._build_filters()
 
         if self.query.strip():
-            must_clauses.append(self._build_text_query())
-
-        filter_clauses = self._build_filters()
+            if self.latest_papers:
+                # Results are ordered by date, so match the text without computing BM25 scores
+                filter_clauses = [self._build_text_query()] + filter_clauses
+            else:
+                must_clauses.append(self._build_text_query())
 
         bool_query = {}
 
@@ -98,16 +233,7 @@ class QueryBuilder:
 
         :returns: Multi-match query for text search
         """
-        return {
-            "multi_match": {
-                "query": self.query,
-                "fields": self.fields,
-                "type": "best_fields",
-                "operator": "or",
-                "fuzziness": "AUTO",
-                "prefix_length": 2,
-            }
-        }
+        return _build_multi_match(self.query, self.fields, self.fuzzy)
 
     def _build_filters(self) -> List[Dict[str, Any]]:
         """Build filter clauses for the query.
@@ -117,7 +243,7 @@ class QueryBuilder:
         filters = []
 
         if self.categories:
-            filters.append({"terms": {"categories": self.categories}})
+            filters.append(build_category_filter(self.categories))
 
         return filters
 
@@ -126,58 +252,14 @@ class QueryBuilder:
 
         :returns: Source field configuration (list for papers, dict for chunks)
         """
-        if self.search_chunks:
-            return {"excludes": ["embedding"]}
-        else:
-            return ["arxiv_id", "title", "authors", "abstract", "categories", "published_date", "pdf_url"]
+        return _SOURCE_CHUNKS if self.search_chunks else _SOURCE_PAPERS
 
     def _build_highlight(self) -> Dict[str, Any]:
         """Build highlighting configuration.
 
         :returns: Highlight configuration dictionary
         """
-        if self.search_chunks:
-            return {
-                "fields": {
-                    "chunk_text": {
-                        "fragment_size": 150,
-                        "number_of_fragments": 2,
-                        "pre_tags": ["<mark>"],
-                        "post_tags": ["</mark>"],
-                    },
-                    "title": {"fragment_size": 0, "number_of_fragments": 0, "pre_tags": ["<mark>"], "post_tags": ["</mark>"]},
-                    "abstract": {
-                        "fragment_size": 150,
-                        "number_of_fragments": 1,
-                        "pre_tags": ["<mark>"],
-                        "post_tags": ["</mark>"],
-                    },
-                },
-                "require_field_match": False,
-            }
-        else:
-            # Paper-specific highlighting
-            return {
-                "fields": {
-                    "title": {
-                        "fragment_size": 0,
-                        "number_of_fragments": 0,
-                    },
-                    "abstract": {
-                        "fragment_size": 150,
-                        "number_of_fragments": 3,
-                        "pre_tags": ["<mark>"],
-                        "post_tags": ["</mark>"],
-                    },
-                    "authors": {
-                        "fragment_size": 0,
-                        "number_of_fragments": 0,
-                        "pre_tags": ["<mark>"],
-                        "post_tags": ["</mark>"],
-                    },
-                },
-                "require_field_match": False,
-            }
+        return _HIGHLIGHT_CHUNKS if self.search_chunks else _HIGHLIGHT_PAPERS
 
     def _build_sort(self) -> Optional[List[Dict[str, Any]]]:
         """Build sorting configuration.
@@ -185,9 +267,9 @@ class QueryBuilder:
         :returns: Sort configuration or None for relevance scoring
         """
         if self.latest_papers:
-            return [{"published_date": {"order": "desc"}}, "_score"]
+            return _LATEST_SORT
 
         if self.query.strip():
             return None
 
-        return [{"published_date": {"order": "desc"}}, "_score"]
+        return _LATEST_SORT
@@ -0,0 +1,60 @@
+"""In-process LRU+TTL cache for search results."""
+
+import threading
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from cachetools import TTLCache
+
+
+class SearchResultCache:
+    """Thread-safe LRU cache with per-entry TTL for search result dicts.
+
+    Keys are built from the full set of search parameters, so only identical
+    requests share an entry. Entries expire after ``ttl`` seconds, and the whole
+    cache is cleared when the owning client writes to the index. Writes from other
+    processes (e.g. the Airflow ingestion DAG) are not seen until entries expire.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30):
+        """Initialize search result cache.
+
+        :param maxsize: Maximum number of cached results
+        :param ttl: Seconds before a cached result expires
+        """
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        query: str, size: int, from_: int, categories: Optional[List[str]], latest: bool, *extra: Hashable
+    ) -> Tuple[Hashable, ...]:
+        """Build a cache key from search parameters.
+
+        :param query: Search query text
+        :param size: Number of results
+        :param from_: Pagination offset
+        :param categories: Optional category filter
+        :param latest: Whether results are sorted by date
+        :param extra: Any additional parameters that change the result
+        :returns: Hashable cache key
+        """
+        return (query, size, from_, tuple(categories or ()), bool(latest), *extra)
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached result and its hits, or None on a miss."""
+        with self._lock:
+            result = self._cache.get(key)
+
+        if result is None:
+            return None
+        return {**result, "hits": [dict(hit) for hit in result["hits"]]}
+
+    def set(self, key: Tuple[Hashable, ...], result: Dict[str, Any]) -> None:
+        """Store a copy of a search result and its hits."""
+        with self._lock:
+            self._cache[key] = {**result, "hits": [dict(hit) for hit in result["hits"]]}
+
+    def clear(self) -> None:
+        """Drop all cached results (called after index writes)."""
+        with self._lock:
+            self._cache.clear()
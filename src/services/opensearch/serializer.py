@@ -0,0 +1,30 @@
+"""orjson-backed serializer for the OpenSearch transport."""
+
+from typing import Any
+
+import orjson
+from opensearchpy.exceptions import SerializationError
+from opensearchpy.serializer import JSONSerializer
+
+
+class ORJSONSerializer(JSONSerializer):
+    """Drop-in JSONSerializer that encodes and decodes with orjson.
+
+    Falls back to JSONSerializer.default for types orjson does not handle natively.
+    """
+
+    def dumps(self, data: Any) -> Any:
+        # Bodies that are already serialized (e.g. bulk lines) pass through untouched
+        if isinstance(data, (str, bytes)):
+            return data
+
+        try:
+            return orjson.dumps(data, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        except (ValueError, TypeError) as e:
+            raise SerializationError(data, e)
+
+    def loads(self, s: str) -> Any:
+        try:
+            return orjson.loads(s)
+        except (ValueError, TypeError) as e:
+            raise SerializationError(s, e)
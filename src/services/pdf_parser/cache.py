@@ -0,0 +1,147 @@
+"""On-disk LRU cache of parsed PDF content, keyed by the PDF's content hash."""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from src.schemas.pdf_parser.models import PdfContent
+
+logger = logging.getLogger(__name__)
+
+# Eviction trims to this fraction of the limit, so writes near the limit do not rescan every time
+_EVICT_TARGET = 0.9
+
+
+class ParsedPdfCache:
+    """Store PdfContent as JSON files named by the BLAKE2b hash of the PDF bytes.
+
+    The same paper downloaded again (re-ingest, retries, test fixtures) hits the cache
+    regardless of its path. Reads refresh a file's mtime. The directory size is scanned
+    once at start-up and then tracked per write; only when that running total passes
+    max_size_bytes is the directory rescanned and trimmed, least recently used first,
+    to _EVICT_TARGET of the limit. Methods do blocking file I/O; call them from a worker thread.
+    """
+
+    def __init__(self, cache_dir: Path, max_size_mb: int = 1024, salt: str = ""):
+        """Initialize parsed PDF cache.
+
+        :param cache_dir: Directory holding the cached results
+        :param max_size_mb: Total size the directory is trimmed back to after writes
+        :param salt: Mixed into every key, so parser settings that change the output
+            (OCR, table structure, page limit) do not share entries
+        """
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self._salt = salt.encode("utf-8")
+        self._size_lock = threading.Lock()
+        self._total_bytes = sum(size for _, size, _ in self._scan())
+
+    def key_for(self, data: bytes) -> str:
+        """Build the cache key for a PDF's contents.
+
+        :param data: PDF file contents
+        :returns: Hex digest of the salt and contents
+        """
+        digest = hashlib.blake2b(self._salt, digest_size=32)
+        digest.update(data)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def lookup(self, data: bytes) -> Tuple[str, Optional[PdfContent]]:
+        """Hash a PDF and return its cached content, if any.
+
+        :param data: PDF file contents
+        :returns: Cache key and the cached PdfContent, or None on a miss
+        """
+        key = self.key_for(data)
+        return key, self.get(key)
+
+    def get(self, key: str) -> Optional[PdfContent]:
+        """Return the cached content for a key, or None on a miss."""
+        path = self._path(key)
+        try:
+            content = PdfContent.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Discarding unreadable parsed PDF cache entry %s: %s", path.name, e)
+            path.unlink(missing_ok=True)
+            return None
+
+        try:
+            # Mark as recently used for eviction
+            os.utime(path)
+        except OSError:
+            pass
+        return content
+
+    def set(self, key: str, content: PdfContent) -> None:
+        """Store content under a key, then evict old entries if over the size limit."""
+        path = self._path(key)
+        tmp_path = None
+        try:
+            data = content.model_dump_json().encode("utf-8")
+            try:
+                replaced = path.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+
+            # Write to a temp file and rename so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            tmp_path = None
+
+            with self._size_lock:
+                self._total_bytes += len(data) - replaced
+                if self._total_bytes > self.max_size_bytes:
+                    self._evict()
+        except OSError as e:
+            logger.warning("Failed to write parsed PDF cache entry %s: %s", key, e)
+        finally:
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+
+    def _scan(self) -> List[Tuple[float, int, str]]:
+        """List cache entries as (mtime, size, path)."""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache fits in _EVICT_TARGET of max_size_bytes.
+
+        Rescans the directory, which also corrects the running total for entries other
+        processes added or removed. Called with _size_lock held.
+        """
+        entries = self._scan()
+        total = sum(size for _, size, _ in entries)
+        target = self.max_size_bytes * _EVICT_TARGET
+
+        if total > self.max_size_bytes:
+            entries.sort()
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+
+        self._total_bytes = total
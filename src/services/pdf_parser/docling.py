@@ -1,178 +1,692 @@
+import asyncio
 import logging
+import re
+from collections import deque
+from concurrent.futures import Executor
+from functools import cache
+from io import BytesIO
+from os import fspath
 from pathlib import Path
-from typing import Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-import pypdfium2 as pdfium
-from docling.datamodel.base_models import InputFormat
-from docling.datamodel.pipeline_options import PdfPipelineOptions
-from docling.document_converter import DocumentConverter, PdfFormatOption
 from src.exceptions import PDFParsingException, PDFValidationError
 from src.schemas.pdf_parser.models import PaperFigure, PaperSection, PaperTable, ParserType, PdfContent
 
+from .cache import ParsedPdfCache
+
+# Docling (which pulls in torch) and pypdfium2 are imported where they are first used, so
+# importing this module (e.g. from src.main) does not load them
+if TYPE_CHECKING:
+    from docling.document_converter import DocumentConverter
+
 logger = logging.getLogger(__name__)
 
+_PDF_MAGIC = b"%PDF-"
+
+# Page-count pre-check: page tree nodes (/Type /Pages) near the end of the file carry /Count
+_TAIL_SCAN_BYTES = 2048
+_PAGES_DICT_RE = re.compile(rb"<<[^<>]*?/Type\s*/Pages\b[^<>]*?>>")
+_COUNT_RE = re.compile(rb"/Count\s+(\d+)")
+
+# Most PDFs parse_many reads and validates ahead of conversion at once; the PDF data they
+# hold in memory is capped separately by read_ahead_mb
+_READ_AHEAD = 8
+
+
+def _find_page_count(data: bytes) -> Optional[int]:
+    """Read the page count from page tree dictionaries in raw PDF bytes.
+
+    :param data: Raw bytes to scan (typically the end of the file)
+    :returns: Largest /Count of any /Type /Pages dictionary, or None if there is none
+    """
+    counts = []
+    for pages_dict in _PAGES_DICT_RE.finditer(data):
+        count = _COUNT_RE.search(pages_dict.group())
+        if count:
+            counts.append(int(count.group(1)))
+    return max(counts) if counts else None
+
+
+class _ReadBudget:
+    """Bytes of PDF data parse_many may hold in memory at once."""
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._used = 0
+        self._freed = asyncio.Event()
+
+    async def acquire(self, size: int) -> int:
+        """Wait until size bytes fit in the budget and reserve them.
+
+        A file larger than the whole budget is admitted once nothing else is reserved.
+
+        :param size: Bytes to reserve
+        :returns: Bytes actually reserved, to pass to release
+        """
+        size = min(size, self._limit)
+        while self._used and self._used + size > self._limit:
+            self._freed.clear()
+            await self._freed.wait()
+        self._used += size
+        return size
+
+    def release(self, size: int) -> None:
+        """Return bytes reserved by acquire."""
+        self._used -= size
+        self._freed.set()
+
+
+async def _aiter_paths(pdf_paths: Union[Iterable[Path], AsyncIterable[Path]]) -> AsyncIterator[Path]:
+    """Iterate plain and async iterables of paths alike."""
+    if isinstance(pdf_paths, AsyncIterable):
+        async for pdf_path in pdf_paths:
+            yield pdf_path
+    else:
+        for pdf_path in pdf_paths:
+            yield pdf_path
+
+
+def _file_size(pdf_path: Path) -> int:
+    """Size of a file in bytes, or 0 if it cannot be read (validation reports why)."""
+    try:
+        return pdf_path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _discard(future: "asyncio.Future[Any]") -> None:
+    """Cancel a future whose result is no longer wanted, or mark its error as retrieved."""
+    if not future.done():
+        future.cancel()
+    elif not future.cancelled():
+        future.exception()
+
+
+# Minimal one-page PDF converted once at startup to load the layout/table models
+_WARMUP_PDF = (
+    b"%PDF-1.4\n"
+    b"1 0 obj\n"
+    b"<< /Type /Catalog /Pages 2 0 R >>\n"
+    b"endobj\n"
+    b"2 0 obj\n"
+    b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>\n"
+    b"endobj\n"
+    b"3 0 obj\n"
+    b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 200 100] /Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>\n"
+    b"endobj\n"
+    b"4 0 obj\n"
+    b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>\n"
+    b"endobj\n"
+    b"5 0 obj\n"
+    b"<< /Length 37 >>\n"
+    b"stream\n"
+    b"BT /F1 12 Tf 20 50 Td (Warm up) Tj ET\n"
+    b"endstream\n"
+    b"endobj\n"
+    b"xref\n"
+    b"0 6\n"
+    b"0000000000 65535 f \n"
+    b"0000000009 00000 n \n"
+    b"0000000058 00000 n \n"
+    b"0000000115 00000 n \n"
+    b"0000000241 00000 n \n"
+    b"0000000311 00000 n \n"
+    b"trailer\n"
+    b"<< /Size 6 /Root 1 0 R >>\n"
+    b"startxref\n"
+    b"398\n"
+    b"%%EOF\n"
+)
+
+
+@cache
+def _build_converter(
+    do_ocr: bool,
+    do_table_structure: bool,
+    layout_batch_size: int,
+    table_batch_size: int,
+    ocr_batch_size: int,
+    batch_max_wait_ms: int,
+    accelerator_device: str,
+    num_threads: int,
+    artifacts_path: str,
+    fast_table_structure: bool,
+) -> "DocumentConverter":
+    """Build a DocumentConverter with the threaded (stage-parallel) PDF pipeline, once per set of options.
+
+    Docling initializes and caches pipelines under its own lock, so a shared converter is safe
+    to call from several threads.
+
+    :returns: DocumentConverter shared by every parser with these options
+    """
+    from docling.datamodel.accelerator_options import AcceleratorOptions
+    from docling.datamodel.base_models import InputFormat
+    from docling.datamodel.pipeline_options import TableFormerMode, ThreadedPdfPipelineOptions
+    from docling.document_converter import DocumentConverter, PdfFormatOption
+    from docling.pipeline.threaded_standard_pdf_pipeline import ThreadedStandardPdfPipeline
+
+    # Configure pipeline options
+    pipeline_options = ThreadedPdfPipelineOptions(
+        do_table_structure=do_table_structure,
+        do_ocr=do_ocr,  # Usually disabled for speed
+        layout_batch_size=layout_batch_size,
+        table_batch_size=table_batch_size,
+        ocr_batch_size=ocr_batch_size,
+        batch_timeout_seconds=batch_max_wait_ms / 1000,
+        accelerator_options=AcceleratorOptions(device=accelerator_device, num_threads=num_threads),
+        artifacts_path=artifacts_path or None,
+    )
+    if fast_table_structure:
+        pipeline_options.table_structure_options.mode = TableFormerMode.FAST
+
+    # Layout, table structure and OCR run as concurrent stages instead of page by page
+    pdf_format_option = PdfFormatOption(pipeline_cls=ThreadedStandardPdfPipeline, pipeline_options=pipeline_options)
+    return DocumentConverter(format_options={InputFormat.PDF: pdf_format_option})
+
 
 class DoclingParser:
     """Docling PDF parser for scientific document processing."""
 
-    def __init__(self, max_pages: int, max_file_size_mb: int, do_ocr: bool = False, do_table_structure: bool = True):
-        """Initialize DocumentConverter with optimized pipeline options.
+    def __init__(
+        self,
+        max_pages: int,
+        max_file_size_mb: int,
+        do_ocr: bool = False,
+        do_table_structure: bool = True,
+        layout_batch_size: int = 4,
+        table_batch_size: int = 4,
+        ocr_batch_size: int = 4,
+        batch_max_wait_ms: int = 2000,
+        accelerator_device: str = "auto",
+        num_threads: int = 4,
+        artifacts_path: str = "",
+        fast_table_structure: bool = False,
+        executor: Optional[Executor] = None,
+        result_cache: Optional[ParsedPdfCache] = None,
+        read_ahead_mb: int = 64,
+    ):
+        """Initialize DocumentConverter with the threaded (stage-parallel) PDF pipeline.
 
         :param max_pages: Maximum number of pages to process
         :param max_file_size_mb: Maximum file size in MB
         :param do_ocr: Enable OCR for scanned PDFs (default: False, very slow)
         :param do_table_structure: Extract table structures (default: True)
+        :param layout_batch_size: Pages per layout model batch
+        :param table_batch_size: Pages per table structure model batch
+        :param ocr_batch_size: Pages per OCR batch
+        :param batch_max_wait_ms: Longest a model stage waits to fill a batch before running a partial one
+        :param accelerator_device: Device for the models ("auto", "cpu", "cuda", "cuda:N" or "mps")
+        :param num_threads: CPU threads per model
+        :param artifacts_path: Local directory with pre-downloaded model weights ("" downloads them)
+        :param fast_table_structure: Use the smaller, faster TableFormer model at some accuracy cost
+        :param executor: Process pool whose workers run the conversion (see init_parse_worker);
+            None converts in a thread of this process
+        :param result_cache: On-disk cache of parsed results keyed by PDF content; None disables it
+        :param read_ahead_mb: PDF data parse_many may hold in memory for files read ahead of conversion
         """
-        # Configure pipeline options
-        pipeline_options = PdfPipelineOptions(
+        # Parsers with the same model options share one converter and its loaded models
+        self._converter = _build_converter(
+            do_ocr=do_ocr,
             do_table_structure=do_table_structure,
-            do_ocr=do_ocr,  # Usually disabled for speed
+            layout_batch_size=layout_batch_size,
+            table_batch_size=table_batch_size,
+            ocr_batch_size=ocr_batch_size,
+            batch_max_wait_ms=batch_max_wait_ms,
+            accelerator_device=accelerator_device,
+            num_threads=num_threads,
+            artifacts_path=artifacts_path,
+            fast_table_structure=fast_table_structure,
         )
-
-        self._converter = DocumentConverter(format_options={InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)})
         self._warmed_up = False
+        self._executor = executor
+        self._result_cache = result_cache
+        # In-flight parses keyed by path, so concurrent requests for one PDF share a single parse
+        self._inflight: Dict[str, "asyncio.Task[Optional[PdfContent]]"] = {}
         self.max_pages = max_pages
         self.max_file_size_bytes = max_file_size_mb * 1024 * 1024
+        self._max_file_size_str = f"{max_file_size_mb:.1f}MB"
+        self.read_ahead_bytes = read_ahead_mb * 1024 * 1024
 
-    def _warm_up_models(self):
-        """Pre-warm the models with a small dummy document to avoid cold start."""
-        if not self._warmed_up:
-            # This happens only once per DoclingParser instance
-            self._warmed_up = True
+    def _warm_up_models(self) -> None:
+        """Pre-warm the models with a small dummy document to avoid cold start.
 
-    def _validate_pdf(self, pdf_path: Path) -> bool:
+        Runs a real conversion of a one-page in-memory PDF so model weights are loaded
+        before the first paper. Failures are logged and the first real parse pays the cost.
+        """
+        if self._warmed_up:
+            return
+
+        # This happens only once per DoclingParser instance
+        self._warmed_up = True
+        try:
+            from docling.datamodel.base_models import DocumentStream
+
+            self._converter.convert(DocumentStream(name="warmup.pdf", stream=BytesIO(_WARMUP_PDF)), max_num_pages=1)
+            logger.info("Docling models warmed up")
+        except Exception as e:
+            logger.warning("Docling warm-up failed, models will load on first parse: %s", e)
+
+    def _validate_pdf(self, pdf_path: Path) -> bytes:
         """Comprehensive PDF validation including size and page limits.
 
+        The header and (when present in the tail) the page count are checked from a few KB
+        before anything else is read, so oversized papers are rejected cheaply. The tail count
+        is only used to reject: it can be stale in incrementally updated files, so any file that
+        passes is read into memory once (it is already capped at max_file_size_mb) and counted
+        by pdfium before the bytes are handed on to the conversion. Whether the file is
+        truncated or corrupted is left to pdfium, which also loads files whose trailer is not
+        in the scanned tail.
+
         :param pdf_path: Path to PDF file
-        :returns: True if PDF appears valid and within limits, False otherwise
+        :returns: PDF file contents if the PDF appears valid and within limits
         """
         try:
+            # Single stat for the existence, emptiness and size checks
+            file_size = pdf_path.stat().st_size
+
             # Check file exists and is not empty
-            if pdf_path.stat().st_size == 0:
-                logger.error(f"PDF file is empty: {pdf_path}")
+            if file_size == 0:
+                logger.error("PDF file is empty: %s", pdf_path)
                 raise PDFValidationError(f"PDF file is empty: {pdf_path}")
 
             # Check file size limit
-            file_size = pdf_path.stat().st_size
             if file_size > self.max_file_size_bytes:
-                logger.warning(
-                    f"PDF file size ({file_size / 1024 / 1024:.1f}MB) exceeds limit ({self.max_file_size_bytes / 1024 / 1024:.1f}MB), skipping processing"
-                )
-                raise PDFValidationError(
-                    f"PDF file too large: {file_size / 1024 / 1024:.1f}MB > {self.max_file_size_bytes / 1024 / 1024:.1f}MB"
-                )
-
-            # Check if file starts with PDF header
+                size_str = f"{file_size / 1024 / 1024:.1f}MB"
+                logger.warning("PDF file size (%s) exceeds limit (%s), skipping processing", size_str, self._max_file_size_str)
+                raise PDFValidationError(f"PDF file too large: {size_str} > {self._max_file_size_str}")
+
             with open(pdf_path, "rb") as f:
-                header = f.read(8)
-                if not header.startswith(b"%PDF-"):
-                    logger.error(f"File does not have PDF header: {pdf_path}")
+                # Check if file starts with PDF header
+                if f.read(len(_PDF_MAGIC)) != _PDF_MAGIC:
+                    logger.error("File does not have PDF header: %s", pdf_path)
                     raise PDFValidationError(f"File does not have PDF header: {pdf_path}")
 
-            # Check page count limit
-            pdf_doc = pdfium.PdfDocument(str(pdf_path))
-            actual_pages = len(pdf_doc)
-            pdf_doc.close()
+                # Check the page tree root near the end of the file before reading the rest, so
+                # papers over the page limit are rejected cheaply
+                f.seek(max(0, file_size - _TAIL_SCAN_BYTES))
+                tail = f.read()
+                tail_pages = _find_page_count(tail)
+                if tail_pages is not None:
+                    self._check_page_count(tail_pages)
+
+                f.seek(0)
+                data = f.read()
 
-            if actual_pages > self.max_pages:
-                logger.warning(
-                    f"PDF has {actual_pages} pages, exceeding limit of {self.max_pages} pages. Skipping processing to avoid performance issues."
-                )
-                raise PDFValidationError(f"PDF has too many pages: {actual_pages} > {self.max_pages}")
+            import pypdfium2 as pdfium
+            import pypdfium2.raw as pdfium_c
 
-            return True
+            # Raises for truncated or corrupted files that pdfium cannot repair
+            pdf_doc = pdfium.PdfDocument(data)
+            try:
+                actual_pages = pdfium_c.FPDF_GetPageCount(pdf_doc.raw)
+            finally:
+                pdf_doc.close()
+            self._check_page_count(actual_pages)
+
+            return data
 
         except PDFValidationError:
             raise
         except Exception as e:
-            logger.error(f"Error validating PDF {pdf_path}: {e}")
+            logger.error("Error validating PDF %s: %s", pdf_path, e)
             raise PDFValidationError(f"Error validating PDF {pdf_path}: {e}")
 
+    def _check_page_count(self, actual_pages: int) -> None:
+        """Raise PDFValidationError when a page count exceeds max_pages."""
+        if actual_pages > self.max_pages:
+            logger.warning(
+                "PDF has %s pages, exceeding limit of %s pages. Skipping processing to avoid performance issues.",
+                actual_pages,
+                self.max_pages,
+            )
+            raise PDFValidationError(f"PDF has too many pages: {actual_pages} > {self.max_pages}")
+
+    def _convert_document(self, pdf_path: Path, data: bytes) -> Any:
+        """Run the Docling conversion on in-memory PDF bytes (blocking).
+
+        :param pdf_path: Path the bytes were read from (used as the document name)
+        :param data: PDF file contents
+        :returns: Converted DoclingDocument
+        """
+        from docling.datamodel.base_models import DocumentStream
+
+        # Convert PDF using the modern API
+        # Limit processing to avoid memory issues with large papers
+        source = DocumentStream(name=pdf_path.name, stream=BytesIO(data))
+        result = self._converter.convert(source, max_num_pages=self.max_pages, max_file_size=self.max_file_size_bytes)
+        return result.document
+
+    def _convert_pdf(self, pdf_path: Path, data: Optional[bytes] = None) -> PdfContent:
+        """Convert an already validated PDF and extract its sections (blocking).
+
+        :param pdf_path: Path to PDF file
+        :param data: PDF file contents if already read; read from pdf_path otherwise
+        :returns: PdfContent object
+        """
+        if data is None:
+            data = pdf_path.read_bytes()
+
+        # Extract structured content
+        return self._build_content(self._convert_document(pdf_path, data))
+
+    def _build_content(self, doc: Any) -> PdfContent:
+        """Extract sections and raw text from a converted Docling document.
+
+        :param doc: Converted DoclingDocument
+        :returns: PdfContent object
+        """
+        # Extract sections from document structure
+        sections = []
+        current_title = "Content"
+        current_parts: List[str] = []
+
+        for element in doc.texts:
+            if getattr(element, "label", None) in ("title", "section_header"):
+                # Save previous section if it has content
+                content = "".join(current_parts).strip()
+                if content:
+                    sections.append(PaperSection(title=current_title, content=content))
+                # Start new section
+                current_title = element.text.strip()
+                current_parts = []
+            else:
+                # Add content to current section
+                text = getattr(element, "text", None)
+                if text:
+                    current_parts.append(text)
+                    current_parts.append("\n")
+
+        # Add final section
+        content = "".join(current_parts).strip()
+        if content:
+            sections.append(PaperSection(title=current_title, content=content))
+
+        # Focus on what arXiv API doesn't provide: structured full text content only
+        return PdfContent(
+            sections=sections,
+            figures=[],  # Removed: basic metadata not useful
+            tables=[],  # Removed: basic metadata not useful
+            raw_text=doc.export_to_text(),
+            references=[],
+            parser_used=ParserType.DOCLING,
+            metadata={"source": "docling", "note": "Content extracted from PDF, metadata comes from arXiv API"},
+        )
+
+    async def parse_many(
+        self, pdf_paths: Union[Iterable[Path], AsyncIterable[Path]], concurrency: int = 1
+    ) -> AsyncIterator[Tuple[Path, Optional[PdfContent]]]:
+        """Parse several PDFs, reading and validating upcoming files while earlier ones convert.
+
+        Paths may arrive from an async iterable (e.g. as downloads finish). Up to _READ_AHEAD files
+        are read ahead, and they may hold at most read_ahead_mb of PDF data in memory. That data stays
+        reserved from the read until the paper's conversion finishes. Up to ``concurrency`` papers
+        convert at once, each through the same cache, executor and in-flight sharing as parse_pdf.
+        Results come back in input order; a paper that exceeds the limits or fails to parse yields
+        None (and is logged) instead of stopping the batch.
+
+        :param pdf_paths: Paths to PDF files
+        :param concurrency: Papers converted at the same time
+        :returns: Async iterator of (path, PdfContent or None)
+        """
+        budget = _ReadBudget(self.read_ahead_bytes)
+        reads: asyncio.Queue = asyncio.Queue(maxsize=_READ_AHEAD)
+        done = object()
+
+        async def read_stage() -> None:
+            async for pdf_path in _aiter_paths(pdf_paths):
+                reserved = await budget.acquire(await asyncio.to_thread(_file_size, pdf_path))
+                read = asyncio.ensure_future(asyncio.to_thread(self._validate_pdf, pdf_path))
+                await reads.put((pdf_path, read, reserved))
+            await reads.put(done)
+
+        def start_parse(pdf_path: Path, read: "asyncio.Future[bytes]", reserved: int) -> "asyncio.Task[Optional[PdfContent]]":
+            task = asyncio.ensure_future(self._parse_read(pdf_path, read))
+            task.add_done_callback(lambda _: budget.release(reserved))
+            return task
+
+        reader = asyncio.create_task(read_stage())
+        running: Deque[Tuple[Path, "asyncio.Task[Optional[PdfContent]]"]] = deque()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(running) < max(1, concurrency):
+                    item = await reads.get()
+                    if item is done:
+                        exhausted = True
+                    else:
+                        running.append((item[0], start_parse(*item)))
+                if not running:
+                    break
+
+                pdf_path, task = running.popleft()
+                try:
+                    content = await task
+                except Exception as e:
+                    logger.error("Failed to parse PDF %s with Docling: %s", pdf_path, e)
+                    content = None
+                yield pdf_path, content
+            # Surface errors from the path iterable
+            await reader
+        finally:
+            reader.cancel()
+            while not reads.empty():
+                item = reads.get_nowait()
+                if item is not done:
+                    _discard(item[1])
+            for _, task in running:
+                _discard(task)
+
     async def parse_pdf(self, pdf_path: Path) -> Optional[PdfContent]:
         """Parse PDF using Docling parser.
         Limited to 20 pages to avoid memory issues with large papers.
 
+        Concurrent calls for the same path await one shared parse instead of converting
+        the file again.
+
         :param pdf_path: Path to PDF file
         :returns: PdfContent object or None if parsing failed
         """
-        try:
-            # Validate PDF first (includes size and page limits)
-            self._validate_pdf(pdf_path)
-
-            # Warm up models on first use
-            self._warm_up_models()
-
-            # Convert PDF using the modern API
-            # Limit processing to avoid memory issues with large papers
-            result = self._converter.convert(str(pdf_path), max_num_pages=self.max_pages, max_file_size=self.max_file_size_bytes)
-
-            # Extract structured content
-            doc = result.document
-
-            # Extract sections from document structure
-            sections = []
-            current_section = {"title": "Content", "content": ""}
-
-            for element in doc.texts:
-                if hasattr(element, "label") and element.label in ["title", "section_header"]:
-                    # Save previous section if it has content
-                    if current_section["content"].strip():
-                        sections.append(PaperSection(title=current_section["title"], content=current_section["content"].strip()))
-                    # Start new section
-                    current_section = {"title": element.text.strip(), "content": ""}
-                else:
-                    # Add content to current section
-                    if hasattr(element, "text") and element.text:
-                        current_section["content"] += element.text + "\n"
-
-            # Add final section
-            if current_section["content"].strip():
-                sections.append(PaperSection(title=current_section["title"], content=current_section["content"].strip()))
-
-            # Focus on what arXiv API doesn't provide: structured full text content only
-            return PdfContent(
-                sections=sections,
-                figures=[],  # Removed: basic metadata not useful
-                tables=[],  # Removed: basic metadata not useful
-                raw_text=doc.export_to_text(),
-                references=[],
-                parser_used=ParserType.DOCLING,
-                metadata={"source": "docling", "note": "Content extracted from PDF, metadata comes from arXiv API"},
-            )
+        return await self._shared_parse(pdf_path, lambda: self._parse_pdf(pdf_path))
+
+    async def _shared_parse(self, pdf_path: Path, parse: Callable[[], Awaitable[Optional[PdfContent]]]) -> Optional[PdfContent]:
+        """Run parse() for pdf_path, or join the parse of the same path already in flight.
 
+        :param pdf_path: Path to PDF file
+        :param parse: Starts the parse when none is in flight for this path
+        :returns: Result of the shared parse
+        """
+        key = fspath(pdf_path)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(parse())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._parse_done(key, done))
+        else:
+            logger.debug("Joining in-flight parse of %s", pdf_path)
+
+        # Shield so one caller's cancellation does not cancel the parse for the others
+        return await asyncio.shield(task)
+
+    def _parse_done(self, key: str, task: "asyncio.Task[Optional[PdfContent]]") -> None:
+        """Drop a finished parse from the in-flight map."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the error as retrieved in case every caller was cancelled; callers still see it
+        if not task.cancelled():
+            task.exception()
+
+    async def _parse_pdf(self, pdf_path: Path) -> Optional[PdfContent]:
+        """Validate and convert one PDF (see parse_pdf).
+
+        :param pdf_path: Path to PDF file
+        :returns: PdfContent object or None if the PDF exceeds the size/page limits
+        """
+        # Validate PDF first (includes size and page limits); reading the file and pdfium are blocking I/O
+        data = await self._within_limits(asyncio.to_thread(self._validate_pdf, pdf_path))
+        if data is None:
+            return None
+        return await self._convert_validated(pdf_path, data)
+
+    async def _parse_read(self, pdf_path: Path, read: Awaitable[bytes]) -> Optional[PdfContent]:
+        """Convert a PDF parse_many has read and validated ahead (see parse_many).
+
+        :param pdf_path: Path to PDF file
+        :param read: Pending _validate_pdf call for pdf_path
+        :returns: PdfContent object or None if the PDF exceeds the size/page limits
+        """
+        data = await self._within_limits(read)
+        if data is None:
+            return None
+        return await self._shared_parse(pdf_path, lambda: self._convert_validated(pdf_path, data))
+
+    @staticmethod
+    async def _within_limits(validation: Awaitable[bytes]) -> Optional[bytes]:
+        """Await a _validate_pdf call, turning size/page limit rejections into None.
+
+        :param validation: Pending _validate_pdf call
+        :returns: PDF file contents, or None if the PDF exceeds the size/page limits
+        """
+        try:
+            return await validation
         except PDFValidationError as e:
             # Handle size/page limit validation errors gracefully by returning None
             error_msg = str(e).lower()
             if "too large" in error_msg or "too many pages" in error_msg:
-                logger.info(f"Skipping PDF processing due to size/page limits: {e}")
+                logger.info("Skipping PDF processing due to size/page limits: %s", e)
                 return None
             else:
                 # Re-raise other validation errors (corrupted files, etc.)
                 raise
+
+    async def _convert_validated(self, pdf_path: Path, data: bytes) -> PdfContent:
+        """Convert a validated PDF, going through the parsed result cache when enabled.
+
+        :param pdf_path: Path to PDF file
+        :param data: PDF file contents returned by _validate_pdf
+        :returns: PdfContent object
+        """
+        try:
+            cache_key = None
+            if self._result_cache is not None:
+                cache_key, content = await asyncio.to_thread(self._result_cache.lookup, data)
+                if content is not None:
+                    logger.debug("Parsed PDF cache hit for %s", pdf_path)
+                    return content
+
+            if self._executor is not None:
+                # Convert in a separate worker process so parses run in parallel outside this GIL.
+                # The worker reads the file itself rather than receiving the bytes through a pipe.
+                loop = asyncio.get_running_loop()
+                content = await loop.run_in_executor(self._executor, parse_in_worker, fspath(pdf_path))
+            else:
+                # Convert the bytes validation already read, in a worker thread so the event loop keeps serving requests
+                content = await asyncio.to_thread(self._convert_pdf, pdf_path, data)
+
+            if cache_key is not None:
+                await asyncio.to_thread(self._result_cache.set, cache_key, content)
+            return content
+
         except Exception as e:
-            logger.error(f"Failed to parse PDF with Docling: {e}")
-            logger.error(f"PDF path: {pdf_path}")
-            logger.error(f"PDF size: {pdf_path.stat().st_size} bytes")
-            logger.error(f"Error type: {type(e).__name__}")
+            logger.error("Failed to parse PDF with Docling: %s", e)
+            logger.error("PDF path: %s", pdf_path)
+            logger.error("PDF size: %s bytes", pdf_path.stat().st_size)
+            logger.error("Error type: %s", type(e).__name__)
 
             # Add specific handling for common issues
             error_msg = str(e).lower()
 
             # Note: Page and size limit checks are now handled in _validate_pdf method
 
-            if "not valid" in error_msg:
-                logger.error("PDF appears to be corrupted or not a valid PDF file")
-                raise PDFParsingException(f"PDF appears to be corrupted or invalid: {pdf_path}")
-            elif "timeout" in error_msg:
-                logger.error("PDF processing timed out - file may be too complex")
-                raise PDFParsingException(f"PDF processing timed out: {pdf_path}")
-            elif "memory" in error_msg or "ram" in error_msg:
-                logger.error("Out of memory - PDF may be too large or complex")
-                raise PDFParsingException(f"Out of memory processing PDF: {pdf_path}")
-            elif "max_num_pages" in error_msg or "page" in error_msg:
-                logger.error(f"PDF processing issue likely related to page limits (current limit: {self.max_pages} pages)")
-                raise PDFParsingException(
-                    f"PDF processing failed, possibly due to page limit ({self.max_pages} pages). Error: {e}"
-                )
-            else:
+            kind = _classify_parse_error(error_msg)
+            if kind is None:
                 raise PDFParsingException(f"Failed to parse PDF with Docling: {e}")
+
+            log_msg, exc_msg = _PARSE_ERROR_MESSAGES[kind]
+            logger.error(log_msg, {"max_pages": self.max_pages})
+            raise PDFParsingException(exc_msg.format(pdf_path=pdf_path, max_pages=self.max_pages, error=e))
+
+
+# Parse failures recognised from the error text, in precedence order when several match
+_PARSE_ERROR_RE = re.compile(r"(?P<corrupt>not valid)|(?P<timeout>timeout)|(?P<memory>memory|ram)|(?P<pages>max_num_pages|page)")
+_PARSE_ERROR_KINDS = ("corrupt", "timeout", "memory", "pages")
+
+# Kind -> (log message with %(max_pages)s, exception message with {pdf_path}/{max_pages}/{error})
+_PARSE_ERROR_MESSAGES: Dict[str, Tuple[str, str]] = {
+    "corrupt": (
+        "PDF appears to be corrupted or not a valid PDF file",
+        "PDF appears to be corrupted or invalid: {pdf_path}",
+    ),
+    "timeout": (
+        "PDF processing timed out - file may be too complex",
+        "PDF processing timed out: {pdf_path}",
+    ),
+    "memory": (
+        "Out of memory - PDF may be too large or complex",
+        "Out of memory processing PDF: {pdf_path}",
+    ),
+    "pages": (
+        "PDF processing issue likely related to page limits (current limit: %(max_pages)s pages)",
+        "PDF processing failed, possibly due to page limit ({max_pages} pages). Error: {error}",
+    ),
+}
+
+
+def _classify_parse_error(error_msg: str) -> Optional[str]:
+    """Match a lowercased error message against the known failure kinds in one regex pass.
+
+    :param error_msg: Lowercased exception message
+    :returns: Highest-precedence matching kind, or None if none match
+    """
+    found = {match.lastgroup for match in _PARSE_ERROR_RE.finditer(error_msg)}
+    return next((kind for kind in _PARSE_ERROR_KINDS if kind in found), None)
+
+
+# Parser owned by the current pool worker process, set by init_parse_worker
+_worker_parser: Optional[DoclingParser] = None
+
+
+def init_parse_worker(parser_kwargs: Dict[str, Any], torch_threads: int) -> None:
+    """Process pool initializer: build and warm up one DoclingParser per worker.
+
+    :param parser_kwargs: DoclingParser constructor arguments
+    :param torch_threads: Torch intra-op threads per worker, to avoid oversubscribing the CPU
+    """
+    global _worker_parser
+
+    import torch
+
+    torch.set_num_threads(torch_threads)
+    # The models set torch's thread count from num_threads when they load, so pass it on too
+    _worker_parser = DoclingParser(**{**parser_kwargs, "num_threads": torch_threads})
+    _worker_parser._warm_up_models()
+
+
+def warm_up_worker() -> None:
+    """No-op pool task; submitting one per worker makes the pool spawn (and so warm up) its workers early."""
+
+
+def parse_in_worker(pdf_path: str) -> PdfContent:
+    """Convert a validated PDF with the worker's parser.
+
+    :param pdf_path: Path to PDF file
+    :returns: PdfContent object
+    """
+    try:
+        return _worker_parser._convert_pdf(Path(pdf_path))
+    except Exception as e:
+        # Docling exceptions do not always pickle; keep the type and message for the caller's error handling
+        raise RuntimeError(f"{type(e).__name__}: {e}") from None
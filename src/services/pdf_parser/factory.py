@@ -1,17 +1,92 @@
-from functools import lru_cache
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
 
 from src.config import get_settings
 
+from .cache import ParsedPdfCache
+from .docling import init_parse_worker, warm_up_worker
 from .parser import PDFParserService
 
+_instance: Optional[PDFParserService] = None
+_lock = threading.Lock()
+
+# Shared by every parser created here; workers are spawned (not forked) so torch starts clean
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
 
-@lru_cache(maxsize=1)
 def make_pdf_parser_service() -> PDFParserService:
-    """Create cached PDF parser service using Docling."""
-    settings = get_settings()
-    return PDFParserService(
-        max_pages=settings.pdf_parser.max_pages,
-        max_file_size_mb=settings.pdf_parser.max_file_size_mb,
-        do_ocr=settings.pdf_parser.do_ocr,
-        do_table_structure=settings.pdf_parser.do_table_structure,
-    )
+    """Get the process-wide PDF parser service using Docling, with models warmed up.
+
+    With settings.pdf_parser.num_workers > 0, conversions run in a process pool whose
+    workers are started right away and each warm up their own parser in the background;
+    otherwise the models are warmed in this process.
+
+    :returns: Shared PDFParserService instance
+    """
+    global _instance, _parse_pool
+
+    if _instance is None:
+        with _lock:
+            if _instance is None:
+                settings = get_settings()
+                parser_kwargs = {
+                    "max_pages": settings.pdf_parser.max_pages,
+                    "max_file_size_mb": settings.pdf_parser.max_file_size_mb,
+                    "do_ocr": settings.pdf_parser.do_ocr,
+                    "do_table_structure": settings.pdf_parser.do_table_structure,
+                    "layout_batch_size": settings.pdf_parser.layout_batch_size,
+                    "table_batch_size": settings.pdf_parser.table_batch_size,
+                    "ocr_batch_size": settings.pdf_parser.ocr_batch_size,
+                    "batch_max_wait_ms": settings.pdf_parser.batch_max_wait_ms,
+                    "accelerator_device": settings.pdf_parser.accelerator_device,
+                    "num_threads": settings.pdf_parser.num_threads,
+                    "artifacts_path": settings.pdf_parser.artifacts_path,
+                    "fast_table_structure": settings.pdf_parser.fast_table_structure,
+                    "read_ahead_mb": settings.pdf_parser.read_ahead_mb,
+                }
+
+                if settings.pdf_parser.num_workers > 0:
+                    _parse_pool = ProcessPoolExecutor(
+                        max_workers=settings.pdf_parser.num_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=init_parse_worker,
+                        initargs=(parser_kwargs, settings.pdf_parser.worker_torch_threads),
+                    )
+
+                result_cache = None
+                if settings.pdf_parser.cache_dir:
+                    # Settings that change the parsed output get separate cache entries
+                    output_options = ("max_pages", "do_ocr", "do_table_structure", "fast_table_structure")
+                    result_cache = ParsedPdfCache(
+                        Path(settings.pdf_parser.cache_dir).resolve(),
+                        max_size_mb=settings.pdf_parser.cache_max_size_mb,
+                        salt=repr([parser_kwargs[name] for name in output_options]),
+                    )
+
+                service = PDFParserService(**parser_kwargs, executor=_parse_pool, result_cache=result_cache)
+                if _parse_pool is None:
+                    service.warm_up()
+                else:
+                    # The pool spawns workers on demand, so without this the first parses pay for the model load
+                    for _ in range(settings.pdf_parser.num_workers):
+                        _parse_pool.submit(warm_up_worker)
+                _instance = service
+
+    return _instance
+
+
+def reset_pdf_parser() -> None:
+    """Shut down the shared PDF parser's worker pool and drop the service so the next call builds new ones.
+
+    Called on API shutdown and from tests.
+    """
+    global _instance, _parse_pool
+
+    with _lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown(cancel_futures=True)
+        _instance = None
+        _parse_pool = None
@@ -1,10 +1,12 @@
 import logging
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterable, AsyncIterator, Iterable, Optional, Tuple, Union
 
 from src.exceptions import PDFParsingException, PDFValidationError
 from src.schemas.pdf_parser.models import PdfContent
 
+from .cache import ParsedPdfCache
 from .docling import DoclingParser
 
 logger = logging.getLogger(__name__)
@@ -13,12 +15,47 @@ logger = logging.getLogger(__name__)
 class PDFParserService:
     """Main PDF parsing service using Docling only."""
 
-    def __init__(self, max_pages: int, max_file_size_mb: int, do_ocr: bool = False, do_table_structure: bool = True):
+    def __init__(
+        self,
+        max_pages: int,
+        max_file_size_mb: int,
+        do_ocr: bool = False,
+        do_table_structure: bool = True,
+        layout_batch_size: int = 4,
+        table_batch_size: int = 4,
+        ocr_batch_size: int = 4,
+        batch_max_wait_ms: int = 2000,
+        accelerator_device: str = "auto",
+        num_threads: int = 4,
+        artifacts_path: str = "",
+        fast_table_structure: bool = False,
+        executor: Optional[Executor] = None,
+        result_cache: Optional[ParsedPdfCache] = None,
+        read_ahead_mb: int = 64,
+    ):
         """Initialize PDF parser service with configurable limits."""
         self.docling_parser = DoclingParser(
-            max_pages=max_pages, max_file_size_mb=max_file_size_mb, do_ocr=do_ocr, do_table_structure=do_table_structure
+            max_pages=max_pages,
+            max_file_size_mb=max_file_size_mb,
+            do_ocr=do_ocr,
+            do_table_structure=do_table_structure,
+            layout_batch_size=layout_batch_size,
+            table_batch_size=table_batch_size,
+            ocr_batch_size=ocr_batch_size,
+            batch_max_wait_ms=batch_max_wait_ms,
+            accelerator_device=accelerator_device,
+            num_threads=num_threads,
+            artifacts_path=artifacts_path,
+            fast_table_structure=fast_table_structure,
+            executor=executor,
+            result_cache=result_cache,
+            read_ahead_mb=read_ahead_mb,
         )
 
+    def warm_up(self) -> None:
+        """Load the Docling models ahead of the first parse."""
+        self.docling_parser._warm_up_models()
+
     async def parse_pdf(self, pdf_path: Path) -> Optional[PdfContent]:
         """Parse PDF using Docling parser only.
 
@@ -43,3 +80,15 @@ class PDFParserService:
         except Exception as e:
             logger.error(f"Docling parsing error for {pdf_path.name}: {e}")
             raise PDFParsingException(f"Docling parsing error for {pdf_path.name}: {e}")
+
+    async def parse_many(
+        self, pdf_paths: Union[Iterable[Path], AsyncIterable[Path]], concurrency: int = 1
+    ) -> AsyncIterator[Tuple[Path, Optional[PdfContent]]]:
+        """Parse several PDFs, reading upcoming files while earlier ones convert.
+
+        :param pdf_paths: Paths to PDF files, e.g. an async iterable fed as downloads finish
+        :param concurrency: Papers converted at the same time
+        :returns: Async iterator of (path, PdfContent or None), in input order
+        """
+        async for pdf_path, content in self.docling_parser.parse_many(pdf_paths, concurrency=concurrency):
+            yield pdf_path, content
@@ -1,6 +1,8 @@
+from typing import Any, Dict
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import pytest_asyncio
 from asgi_lifespan import LifespanManager
 from httpx import ASGITransport, AsyncClient
 from src.main import app
@@ -12,36 +14,70 @@ def anyio_backend() -> str:
     return "asyncio"
 
 
-@pytest.fixture
-async def client():
-    """HTTP client for API testing with mocked services."""
-    # Mock database startup and session to prevent real connections
+def _configure_mocks(mocks: Dict[str, Any]) -> None:
+    """Reset call history and restore the default mock behaviour."""
+    for mock in mocks.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+
+    # Mock startup to do nothing
+    mocks["startup"].return_value = None
+
+    # Mock get_session to return a mock session
+    mock_session = MagicMock()
+    mocks["get_session"].return_value.__enter__.return_value = mock_session
+    mocks["get_session"].return_value.__exit__.return_value = None
+
+    # Mock repository methods to return None (not found) by default
+    mocks["get_by_id"].return_value = None
+
+    # Set up other mock return values; an unhealthy sync client makes startup skip index setup
+    mocks["opensearch"].return_value = MagicMock()
+    mocks["opensearch"].return_value.health_check.return_value = False
+    mocks["async_opensearch"].return_value = AsyncMock()
+    mocks["arxiv"].return_value = AsyncMock()
+    mocks["embeddings"].return_value = AsyncMock()
+    mocks["pdf_parser"].return_value = AsyncMock()
+    mocks["ollama"].return_value = AsyncMock()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _app_with_mocks():
+    """App with mocked services, started once for the whole test session."""
+    # Mock database startup and session to prevent real connections. The lifespan and
+    # dependencies import their factories directly, so they are patched where they are used.
     with (
         patch("src.db.interfaces.postgresql.PostgreSQLDatabase.startup") as mock_startup,
         patch("src.db.interfaces.postgresql.PostgreSQLDatabase.get_session") as mock_get_session,
-        patch("src.services.opensearch.factory.make_opensearch_client") as mock_os,
-        patch("src.services.arxiv.factory.make_arxiv_client") as mock_arxiv,
-        patch("src.services.pdf_parser.factory.make_pdf_parser_service") as mock_pdf,
+        patch("src.main.make_opensearch_client") as mock_os,
+        patch("src.main.make_async_opensearch_client") as mock_async_os,
+        patch("src.main.make_arxiv_client") as mock_arxiv,
+        patch("src.main.make_embeddings_service") as mock_embeddings,
+        patch("src.dependencies.make_pdf_parser_service") as mock_pdf,
         patch("src.services.ollama.client.OllamaClient") as mock_ollama,
         patch("src.repositories.paper.PaperRepository.get_by_arxiv_id") as mock_get_by_id,
     ):
-        # Mock startup to do nothing
-        mock_startup.return_value = None
+        mocks = {
+            "startup": mock_startup,
+            "get_session": mock_get_session,
+            "opensearch": mock_os,
+            "async_opensearch": mock_async_os,
+            "arxiv": mock_arxiv,
+            "embeddings": mock_embeddings,
+            "pdf_parser": mock_pdf,
+            "ollama": mock_ollama,
+            "get_by_id": mock_get_by_id,
+        }
+        _configure_mocks(mocks)
 
-        # Mock get_session to return a mock session
-        mock_session = MagicMock()
-        mock_get_session.return_value.__enter__.return_value = mock_session
-        mock_get_session.return_value.__exit__.return_value = None
+        async with LifespanManager(app) as manager:
+            yield manager.app, mocks
 
-        # Mock repository methods to return None (not found) by default
-        mock_get_by_id.return_value = None
 
-        # Set up other mock return values
-        mock_os.return_value = AsyncMock()
-        mock_arxiv.return_value = AsyncMock()
-        mock_pdf.return_value = AsyncMock()
-        mock_ollama.return_value = AsyncMock()
+@pytest_asyncio.fixture(loop_scope="session")
+async def client(_app_with_mocks):
+    """HTTP client for API testing with mocked services."""
+    asgi_app, mocks = _app_with_mocks
+    _configure_mocks(mocks)
 
-        async with LifespanManager(app) as manager:
-            async with AsyncClient(transport=ASGITransport(app=manager.app), base_url="http://test") as client:
-                yield client
+    async with AsyncClient(transport=ASGITransport(app=asgi_app), base_url="http://test") as client:
+        yield client
@@ -0,0 +1,103 @@
+"""API tests for the hybrid search router, with OpenSearch and embeddings mocked."""
+
+from typing import Any, Dict
+
+import pytest
+from src.main import app
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+HIT = {
+    "arxiv_id": "2401.00001",
+    "title": "A Sample Paper",
+    "authors": ["Jane Doe"],
+    "abstract": "An abstract.",
+    "published_date": "2024-01-01T00:00:00",
+    "pdf_url": "https://arxiv.org/pdf/2401.00001",
+    "score": 1.5,
+    "chunk_text": "Some chunk text.",
+    "chunk_id": "2401.00001_0",
+    "section_name": "Introduction",
+}
+
+
+@pytest.fixture
+def search_services(_app_with_mocks) -> Dict[str, Any]:
+    """The app's async OpenSearch client and embeddings service mocks, reset for each test."""
+    opensearch = app.state.async_opensearch_client
+    embeddings = app.state.embeddings_service
+    for service in (opensearch, embeddings):
+        service.reset_mock(return_value=True, side_effect=True)
+
+    opensearch.health_check.return_value = True
+    opensearch.search_unified.return_value = {"total": 1, "hits": [HIT]}
+    embeddings.embed_query.return_value = [0.1] * 1024
+    return {"opensearch": opensearch, "embeddings": embeddings}
+
+
+async def test_bm25_search(client, search_services):
+    response = await client.post("/api/v1/hybrid-search/", json={"query": "neural networks", "use_hybrid": False})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["search_mode"] == "bm25"
+    assert data["total"] == 1
+    assert data["hits"][0]["arxiv_id"] == HIT["arxiv_id"]
+    assert data["hits"][0]["section_name"] == HIT["section_name"]
+    search_services["embeddings"].embed_query.assert_not_called()
+    assert search_services["opensearch"].search_unified.call_args.kwargs["query_embedding"] is None
+
+
+async def test_hybrid_search_embeds_the_query(client, search_services):
+    response = await client.post("/api/v1/hybrid-search/", json={"query": "neural networks", "size": 5})
+
+    assert response.status_code == 200
+    assert response.json()["search_mode"] == "hybrid"
+    search_services["embeddings"].embed_query.assert_awaited_once_with("neural networks")
+    call = search_services["opensearch"].search_unified.call_args.kwargs
+    assert call["query_embedding"] == [0.1] * 1024
+    assert call["size"] == 5
+
+
+async def test_hybrid_search_falls_back_to_bm25_when_embedding_fails(client, search_services):
+    search_services["embeddings"].embed_query.side_effect = RuntimeError("embeddings unavailable")
+
+    response = await client.post("/api/v1/hybrid-search/", json={"query": "neural networks"})
+
+    assert response.status_code == 200
+    assert response.json()["search_mode"] == "bm25"
+    assert search_services["opensearch"].search_unified.call_args.kwargs["query_embedding"] is None
+
+
+async def test_hybrid_search_unavailable_when_cluster_unhealthy(client, search_services):
+    search_services["opensearch"].health_check.return_value = False
+
+    response = await client.post("/api/v1/hybrid-search/", json={"query": "neural networks", "use_hybrid": False})
+
+    assert response.status_code == 503
+    search_services["opensearch"].search_unified.assert_not_called()
+
+
+async def test_trimmed_search_returns_opensearch_body(client, search_services):
+    body = b'{"hits":{"total":{"value":1},"hits":[{"_id":"2401.00001_0","_score":1.5,"_source":{"arxiv_id":"2401.00001"}}]}}'
+    search_services["opensearch"].search_papers_trimmed.return_value = body
+
+    response = await client.post(
+        "/api/v1/hybrid-search/trimmed", json={"query": "neural networks", "size": 20, "from": 40, "categories": ["cs.AI"]}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == body
+    search_services["opensearch"].search_papers_trimmed.assert_awaited_once_with(
+        query="neural networks", size=20, from_=40, categories=["cs.AI"], latest=False
+    )
+
+
+async def test_trimmed_search_error(client, search_services):
+    search_services["opensearch"].search_papers_trimmed.side_effect = RuntimeError("cluster down")
+
+    response = await client.post("/api/v1/hybrid-search/trimmed", json={"query": "neural networks"})
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Search failed: cluster down"
@@ -0,0 +1,98 @@
+"""Regression tests pinning TextChunker output to the pre-optimization implementation.
+
+data/text_chunker_baseline.json holds the chunks produced for the sample paper below by the
+original chunker, with only the literal '\\n\\n' separator in combined chunks corrected to a real
+blank line. The faster word slicing, span arithmetic and section filtering must keep every chunk's
+text, word count, overlaps and character offsets unchanged.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from src.schemas.indexing.models import TextChunk
+from src.services.indexing.text_chunker import TextChunker
+
+BASELINE_PATH = Path(__file__).parent / "data" / "text_chunker_baseline.json"
+
+ARXIV_ID = "2401.00001"
+PAPER_ID = "42"
+
+
+def _words(prefix: str, count: int) -> str:
+    """Deterministic filler text with irregular whitespace, so character offsets are exercised."""
+    separators = (" ", "  ", "\n", " \t ")
+    return "".join(f"{prefix}{i}{separators[i % len(separators)]}" for i in range(count)).strip()
+
+
+def sample_paper() -> Dict[str, Any]:
+    """Paper covering every chunking path: metadata and abstract-duplicate sections, small sections
+    merged into the previous chunk or combined on their own, single-chunk sections and a large split section.
+    """
+    abstract = _words("abs", 60)
+    return {
+        "title": "A Sample Paper on Chunking",
+        "abstract": abstract,
+        "full_text": _words("ft", 1700),
+        "sections": {
+            "Authors": "Jane Doe, University of Somewhere, jane@somewhere.edu",
+            "Abstract": abstract,
+            # Restates the abstract's words in another order plus much more text
+            "Overview": " ".join(reversed(abstract.split())) + " " + _words("ov", 300),
+            "Introduction": _words("intro", 300),
+            "Notation": _words("nota", 40),
+            "Setup": _words("setup", 50),
+            "Method": _words("method", 1500),
+            "Ablations": _words("abl", 80),
+            "Limitations": _words("lim", 90),
+            "Conclusion": _words("conc", 120),
+        },
+    }
+
+
+def _dump(chunks: List[TextChunk]) -> List[Dict[str, Any]]:
+    return [chunk.model_dump() for chunk in chunks]
+
+
+@pytest.fixture(scope="module")
+def baseline() -> Dict[str, List[Dict[str, Any]]]:
+    return json.loads(BASELINE_PATH.read_text())
+
+
+def test_chunk_text_matches_baseline(baseline):
+    paper = sample_paper()
+    chunks = TextChunker().chunk_text(paper["full_text"], ARXIV_ID, PAPER_ID)
+
+    assert _dump(chunks) == baseline["chunk_text"]
+
+
+def test_chunk_paper_sections_match_baseline(baseline):
+    paper = sample_paper()
+    chunks = TextChunker().chunk_paper(
+        title=paper["title"],
+        abstract=paper["abstract"],
+        full_text=paper["full_text"],
+        arxiv_id=ARXIV_ID,
+        paper_id=PAPER_ID,
+        sections=paper["sections"],
+    )
+
+    assert _dump(chunks) == baseline["chunk_paper"]
+
+
+def test_combined_sections_are_joined_with_real_newlines():
+    paper = sample_paper()
+    chunks = TextChunker().chunk_paper(
+        title=paper["title"],
+        abstract=paper["abstract"],
+        full_text=paper["full_text"],
+        arxiv_id=ARXIV_ID,
+        paper_id=PAPER_ID,
+        sections=paper["sections"],
+    )
+
+    combined = [chunk for chunk in chunks if "+" in (chunk.metadata.section_title or "")]
+    assert combined
+    for chunk in combined:
+        assert "\\n" not in chunk.text